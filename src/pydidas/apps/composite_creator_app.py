@@ -42,7 +42,6 @@ from pydidas.core.utils import (
     check_hdf5_key_exists_in_file,
     copy_docstring,
     get_extension,
-    rebin2d,
 )
 from pydidas.data_io import import_data
 from pydidas.managers import (
@@ -225,9 +224,13 @@ class CompositeCreatorApp(BaseApp):
             _mask = _mask[self._image_metadata.roi]
         _bin = self.get_param_value("binning")
         if _bin > 1:
-            _mask = rebin2d(_mask, _bin)
-            _mask = np.where(_mask > 0, 1, 0)
-            _mask = _mask.astype(np.bool_)
+            # a binned pixel is masked if any of its source pixels are masked:
+            _n0, _n1 = _mask.shape[0] // _bin, _mask.shape[1] // _bin
+            _mask = (
+                _mask[: _n0 * _bin, : _n1 * _bin]
+                .reshape(_n0, _bin, _n1, _bin)
+                .any(axis=(1, 3))
+            )
         self._det_mask = _mask
 
     def __verify_number_of_images_fits_composite(self):
@@ -139,21 +139,14 @@ class Scan(ObjectWithParameterCollection):
         tuple
             The scan indices.
         """
-        _n_frames = self.n_points * multiplicity
+        _shape = self.shape
+        _n_frames = int(np.prod(_shape)) * multiplicity
         if not 0 <= index < _n_frames:
             raise UserConfigError(
                 f"The demanded frame number {index} is out of the scope of the Scan "
                 f"indices (0, {_n_frames})."
             )
-        _ndim = self.get_param_value("scan_dim")
-        _N = [self.get_param_value(f"scan_dim{_n}_n_points") for _n in range(_ndim)] + [
-            multiplicity
-        ]
-        _indices = [0] * _ndim
-        for _dim in range(_ndim):
-            _indices[_dim] = index // np.prod(_N[_dim + 1 :])
-            index -= _indices[_dim] * np.prod(_N[_dim + 1 :])
-        return tuple(_indices)
+        return np.unravel_index(index // multiplicity, _shape)
 
     def get_frame_from_indices(self, indices: tuple) -> int:
         """
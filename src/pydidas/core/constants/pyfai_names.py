@@ -35,32 +35,38 @@ __all__ = [
 ]
 
 
+from types import MappingProxyType
+
 import pyFAI.detectors as __det
 
 
 __class_names = __det._detector_class_names
 
 
-pyFAI_UNITS = {
-    "Q / nm^-1": "q_nm^-1",
-    "Q / A^-1": "q_A^-1",
-    "2theta / deg": "2th_deg",
-    "2theta / rad": "2th_rad",
-    "r / mm": "r_mm",
-    "chi / deg": "chi_deg",
-    "chi / rad": "chi_rad",
-}
+pyFAI_UNITS = MappingProxyType(
+    {
+        "Q / nm^-1": "q_nm^-1",
+        "Q / A^-1": "q_A^-1",
+        "2theta / deg": "2th_deg",
+        "2theta / rad": "2th_rad",
+        "r / mm": "r_mm",
+        "chi / deg": "chi_deg",
+        "chi / rad": "chi_rad",
+    }
+)
 
-pyFAI_METHOD = {
-    "CSR": ("bbox", "csr", "cython"),
-    "CSR OpenCL": ("bbox", "csr", "opencl"),
-    "CSR full": ("full", "csr", "cython"),
-    "CSR full OpenCL": ("full", "csr", "opencl"),
-    "CSC": ("bbox", "csc", "cython"),
-    "CSC OpenCL": ("bbox", "csc", "opencl"),
-    "CSC full": ("full", "csc", "cython"),
-    "CSC full OpenCL": ("full", "csc", "opencl"),
-}
+pyFAI_METHOD = MappingProxyType(
+    {
+        "CSR": ("bbox", "csr", "cython"),
+        "CSR OpenCL": ("bbox", "csr", "opencl"),
+        "CSR full": ("full", "csr", "cython"),
+        "CSR full OpenCL": ("full", "csr", "opencl"),
+        "CSC": ("bbox", "csc", "cython"),
+        "CSC OpenCL": ("bbox", "csc", "opencl"),
+        "CSC full": ("full", "csc", "cython"),
+        "CSC full OpenCL": ("full", "csc", "opencl"),
+    }
+)
 
 
 PYFAI_DETECTOR_MANUFACTURERS = set()
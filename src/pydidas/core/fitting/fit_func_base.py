@@ -54,6 +54,7 @@ class FitFuncBase(metaclass=FitFuncMeta):
     num_peak_params = 3
     center_param_index = 2
     amplitude_param_index = 0
+    has_analytic_jacobian = False
 
     @staticmethod
     def func(c: tuple[Real], x: ndarray) -> ndarray:
@@ -103,6 +104,8 @@ class FitFuncBase(metaclass=FitFuncMeta):
             )
             for _i_peak in range(cls.num_peaks)
         )
+        if len(c) == cls.num_peaks * cls.num_peak_params:
+            return _peaks
         _background = cls.calculate_background(c, x)
         return _peaks + _background
 
@@ -153,6 +156,67 @@ class FitFuncBase(metaclass=FitFuncMeta):
         """
         return cls.profile(c, x) - data
 
+    @staticmethod
+    def func_jacobian(c: tuple[Real], x: ndarray) -> ndarray:
+        """
+        Get the partial derivatives of the function with respect to its parameters.
+
+        This method needs to be implemented by each fitting function which sets
+        the has_analytic_jacobian flag.
+
+        Parameters
+        ----------
+        c : tuple[Real]
+            The fit parameters of a single peak.
+        x : ndarray
+            The input x data points.
+
+        Returns
+        -------
+        ndarray
+            The partial derivatives in the shape (num_peak_params, x.size).
+        """
+        raise NotImplementedError(
+            "The func_jacobian method must be implemented by the specific FitFunc"
+        )
+
+    @classmethod
+    def jacobian(cls, c: tuple[Real], x: ndarray, data: ndarray) -> ndarray:
+        """
+        Get the Jacobian of the delta between the fit and the data.
+
+        The signature is identical to the delta method to allow passing both
+        to scipy's least_squares with the same arguments.
+
+        Parameters
+        ----------
+        c : tuple
+            The tuple with the function parameters.
+        x : np.ndarray
+            The x points to calculate the function values.
+        data : np.ndarray
+            The data values. These are not required for the Jacobian.
+
+        Returns
+        -------
+        np.ndarray
+            The Jacobian in the shape (x.size, len(c)).
+        """
+        _n_peak_params = cls.num_peaks * cls.num_peak_params
+        if len(c) > _n_peak_params + 2:
+            raise ValueError("The order of the background is not supported.")
+        _jac = np.empty((x.size, len(c)))
+        for _i_peak in range(cls.num_peaks):
+            _slice = slice(
+                _i_peak * cls.num_peak_params, (_i_peak + 1) * cls.num_peak_params
+            )
+            _jac[:, _slice] = cls.func_jacobian(c[_slice], x).T
+        if len(c) > _n_peak_params:
+            _jac[:, _n_peak_params] = 1
+        if len(c) > _n_peak_params + 1:
+            _jac[:, _n_peak_params + 1] = x
+        return _jac
+
     @classmethod
     def area(cls, c: tuple[Real]) -> tuple[Real]:
         """
@@ -29,7 +29,7 @@ __all__ = ["Gaussian"]
 from numbers import Real
 from typing import Dict, Optional
 
-from numpy import amax, amin, exp, inf, ndarray, pi
+from numpy import amax, amin, exp, inf, ndarray, pi, stack
 
 from pydidas.core.fitting.fit_func_base import FitFuncBase
 
@@ -46,6 +46,7 @@ class Gaussian(FitFuncBase):
     num_peak_params = 3
     center_param_index = 2
     amplitude_param_index = 0
+    has_analytic_jacobian = True
 
     @staticmethod
     def func(c: tuple[Real], x: ndarray) -> ndarray:
@@ -77,7 +78,39 @@ class Gaussian(FitFuncBase):
             The Gaussian function values for the input parameters.
         """
         return (
-            c[0] * (2 * pi) ** (-0.5) / c[1] * exp(-((x - c[2]) ** 2) / (2 * c[1] ** 2))
+            c[0] * (2 * pi) ** (-0.5) / c[1] * exp((x - c[2]) ** 2 * (-0.5 / c[1] ** 2))
+        )
+
+    @staticmethod
+    def func_jacobian(c: tuple[Real], x: ndarray) -> ndarray:
+        """
+        Get the partial derivatives of the Gaussian function.
+
+        Parameters
+        ----------
+        c : tuple
+            The tuple with the function parameters.
+            c[0] : amplitude
+            c[1] : sigma
+            c[2] : expectation value
+        x : ndarray
+            The input x data points.
+
+        Returns
+        -------
+        ndarray
+            The derivatives with respect to the amplitude, sigma and
+            expectation value in the shape (3, x.size).
+        """
+        _dx = x - c[2]
+        _norm_profile = (2 * pi) ** (-0.5) / c[1] * exp(_dx**2 * (-0.5 / c[1] ** 2))
+        _profile = c[0] * _norm_profile
+        return stack(
+            [
+                _norm_profile,
+                _profile * (_dx**2 - c[1] ** 2) / c[1] ** 3,
+                _profile * _dx / c[1] ** 2,
+            ]
         )
 
     @classmethod
@@ -104,9 +137,11 @@ class Gaussian(FitFuncBase):
         tuple[Real]
             The list with estimated amplitude, width and center parameters.
         """
-        if amin(y) < 0:
-            y = y + max(amin(y), -0.2 * amax(y))
+        _ymin = amin(y)
+        if _ymin < 0:
+            y = y + max(_ymin, -0.2 * amax(y))
             y[y < 0] = 0
+            _ymin = 0
 
         _center_start = kwargs.get(f"center{index}_start", x[y.argmax()])
         if "bounds" in kwargs:
@@ -130,7 +165,7 @@ class Gaussian(FitFuncBase):
         # estimate the amplitude based on the maximum data height and the
         # height of the normalized distribution which is
         # 1 / (sqrt(2 * PI) * sigma) = 1 / (0.40 * sigma)
-        _amp = (_ycenter - amin(y)) * 2.5 * _sigma_start
+        _amp = (_ycenter - _ymin) * 2.5 * _sigma_start
         return _amp, _sigma_start, _center_start
 
     @classmethod
@@ -29,7 +29,7 @@ __all__ = ["Lorentzian"]
 from numbers import Real
 from typing import Optional
 
-from numpy import amax, amin, inf, ndarray, pi
+from numpy import amax, amin, inf, ndarray, pi, stack
 
 from pydidas.core.fitting.fit_func_base import FitFuncBase
 
@@ -46,6 +46,7 @@ class Lorentzian(FitFuncBase):
     amplitude_param_index = 0
     num_peak_params = 3
     center_param_index = 2
+    has_analytic_jacobian = True
 
     @staticmethod
     def func(c: tuple[Real], x: ndarray) -> ndarray:
@@ -77,6 +78,38 @@ class Lorentzian(FitFuncBase):
         """
         return c[0] * (c[1] / pi) / ((x - c[2]) ** 2 + c[1] ** 2)
 
+    @staticmethod
+    def func_jacobian(c: tuple[Real], x: ndarray) -> ndarray:
+        """
+        Get the partial derivatives of the Lorentzian function.
+
+        Parameters
+        ----------
+        c : tuple[Real]
+            The tuple with the function parameters.
+            c[0] : amplitude
+            c[1] : gamma
+            c[2] : center
+        x : ndarray
+            The input x data points.
+
+        Returns
+        -------
+        ndarray
+            The derivatives with respect to the amplitude, gamma and center
+            in the shape (3, x.size).
+        """
+        _dx = x - c[2]
+        _denom = 1 / (_dx**2 + c[1] ** 2)
+        _norm_profile = (c[1] / pi) * _denom
+        return stack(
+            [
+                _norm_profile,
+                (c[0] / pi) * (_dx**2 - c[1] ** 2) * _denom**2,
+                2 * c[0] * _norm_profile * _dx * _denom,
+            ]
+        )
+
     @classmethod
     def guess_peak_start_params(
         cls, x: ndarray, y: ndarray, index: Optional[int] = None, **kwargs: dict
@@ -101,9 +134,11 @@ class Lorentzian(FitFuncBase):
         tuple[Real]
             The list with estimated amplitude, width and center parameters.
         """
-        if amin(y) < 0:
-            y = y + max(amin(y), -0.2 * amax(y))
+        _ymin = amin(y)
+        if _ymin < 0:
+            y = y + max(_ymin, -0.2 * amax(y))
             y[y < 0] = 0
+            _ymin = 0
         _center_start = kwargs.get(f"center{index}_start", x[y.argmax()])
         if "bounds" in kwargs:
             _bounds_index = 2 if index is None else 3 * index + 2
@@ -126,7 +161,7 @@ class Lorentzian(FitFuncBase):
         # estimate the amplitude based on the maximum data height and the
         # height of the normalized distribution which is 2 / (pi * Gamma).
         # Because the FWHM is often underestimated, ignore the factor 2
-        _amp = (_ycenter - amin(y)) * _gamma_start * pi
+        _amp = (_ycenter - _ymin) * _gamma_start * pi
         return _amp, _gamma_start, _center_start
 
     @classmethod
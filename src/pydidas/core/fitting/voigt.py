@@ -29,8 +29,8 @@ __all__ = ["Voigt"]
 from numbers import Real
 from typing import Union
 
-from numpy import amax, amin, inf, ndarray
-from scipy.special import voigt_profile
+from numpy import amax, amin, inf, ndarray, pi, stack
+from scipy.special import voigt_profile, wofz
 
 from pydidas.core.fitting.fit_func_base import FitFuncBase
 
@@ -47,6 +47,7 @@ class Voigt(FitFuncBase):
     amplitude_param_index = 0
     num_peak_params = 4
     center_param_index = 3
+    has_analytic_jacobian = True
 
     @staticmethod
     def func(c: tuple[Real], x: ndarray) -> ndarray:
@@ -74,6 +75,48 @@ class Voigt(FitFuncBase):
         """
         return c[0] * voigt_profile(x - c[3], c[1], c[2])
 
+    @staticmethod
+    def func_jacobian(c: tuple[Real], x: ndarray) -> ndarray:
+        """
+        Get the partial derivatives of the Voigt function.
+
+        The Voigt profile is expressed with the Faddeeva function w(z) as
+        V = Re[w(z)] / (sigma * sqrt(2 * pi)) with
+        z = (x - center + i * gamma) / (sigma * sqrt(2)). The derivatives
+        follow from w'(z) = -2 * z * w(z) + 2 * i / sqrt(pi).
+
+        Parameters
+        ----------
+        c : tuple
+            The tuple with the function parameters.
+            c[0] : amplitude
+            c[1] : sigma
+            c[2] : gamma
+            c[3] : center
+        x : ndarray
+            The input x data points.
+
+        Returns
+        -------
+        ndarray
+            The derivatives with respect to the amplitude, sigma, gamma and
+            center in the shape (4, x.size).
+        """
+        _z = (x - c[3] + 1j * c[2]) / (c[1] * 2**0.5)
+        _w = wofz(_z)
+        _dw = -2 * _z * _w + 2j / pi**0.5
+        _norm = 1 / (c[1] * (2 * pi) ** 0.5)
+        _norm_profile = _norm * _w.real
+        _dw_factor = c[0] / (2 * pi**0.5 * c[1] ** 2)
+        return stack(
+            [
+                _norm_profile,
+                -c[0] / c[1] * (_norm_profile + _norm * (_z * _dw).real),
+                -_dw_factor * _dw.imag,
+                -_dw_factor * _dw.real,
+            ]
+        )
+
     @classmethod
     def guess_peak_start_params(
         cls, x: ndarray, y: ndarray, index: Union[None, int], **kwargs: dict
@@ -98,9 +141,11 @@ class Voigt(FitFuncBase):
         tuple[Real]
             The list with estimated amplitude, width and center parameters.
         """
-        if amin(y) < 0:
-            y = y + max(amin(y), -0.2 * amax(y))
+        _ymin = amin(y)
+        if _ymin < 0:
+            y = y + max(_ymin, -0.2 * amax(y))
             y[y < 0] = 0
+            _ymin = 0
         _center_start = kwargs.get(f"center{index}_start", x[y.argmax()])
         if "bounds" in kwargs:
             _bounds_index = 3 if index is None else 4 * index + 3
@@ -117,16 +162,14 @@ class Voigt(FitFuncBase):
         else:
             if _high_x.size > 1:
                 _gamma_start = 0.34 * (x[_high_x[-1]] - x[_high_x[0]])
-                _sigma_start = 0.34 * (x[_high_x[-1]] - x[_high_x[0]])
             elif _high_x.size == 1:
                 _gamma_start = 0.34 * (x[1] - x[0])
-                _sigma_start = 0.34 * (x[1] - x[0])
             else:
                 _gamma_start = (x[-1] - x[0]) / 6
-                _sigma_start = (x[-1] - x[0]) / 6
+            _sigma_start = _gamma_start
         # estimate the amplitude based on the maximum data height and the
         # height of the normalized distribution
-        _amp = (_ycenter - amin(y)) / voigt_profile(0, _sigma_start, _gamma_start)
+        _amp = (_ycenter - _ymin) / voigt_profile(0, _sigma_start, _gamma_start)
         return _amp, _sigma_start, _gamma_start, _center_start
 
     @classmethod
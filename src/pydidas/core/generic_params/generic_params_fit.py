@@ -61,6 +61,20 @@ GENERIC_PARAMS_FIT = (
                 "'None' will not impose any limits on the peak height."
             ),
         },
+        "fit_tolerance": {
+            "type": float,
+            "default": 1e-6,
+            "name": "Fit convergence tolerance",
+            "choices": None,
+            "allow_None": False,
+            "unit": "",
+            "tooltip": (
+                "The relative tolerance for the convergence of the least squares "
+                "fit. It is used for the change of the cost function, the change "
+                "of the fit parameters and the gradient. Smaller values require "
+                "more iterations."
+            ),
+        },
         "fit_func": {
             "type": str,
             "default": "Gaussian",
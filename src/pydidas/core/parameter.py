@@ -29,6 +29,7 @@ __all__ = ["Parameter"]
 
 
 import copy
+import html
 import warnings
 from collections.abc import Iterable
 from numbers import Integral, Real
@@ -174,6 +175,7 @@ class Parameter:
         self.__refkey = refkey
         self.__type = _get_base_class(param_type)
         self.__value = None
+        self.__html_tooltip = None
         if isinstance(meta, dict):
             kwargs.update(meta)
         self.__meta = dict(
@@ -406,6 +408,23 @@ class Parameter:
             _t += f" (type: {str(self.dtype)})"
         return _t.replace(") (", ", ")
 
+    @property
+    def html_tooltip(self) -> str:
+        """
+        Get the Parameter tooltip, escaped and formatted for Qt rich text.
+
+        The formatted tooltip is cached because the tooltip, unit and type
+        are fixed after the Parameter has been created.
+
+        Returns
+        -------
+        str
+            The formatted tooltip for the Parameter.
+        """
+        if self.__html_tooltip is None:
+            self.__html_tooltip = f"<qt>{html.escape(self.tooltip)}</qt>"
+        return self.__html_tooltip
+
     @property
     def choices(self) -> Union[None, list]:
         """
@@ -36,6 +36,7 @@ __all__ = [
     "get_range_as_formatted_string",
     "update_separators",
     "format_input_to_multiline_str",
+    "format_input_to_multiline_list",
     "get_random_string",
     "get_simplified_array_representation",
     "get_param_description_from_docstring",
@@ -59,6 +60,9 @@ import numpy as np
 from pydidas.core.constants import ASCII_TO_UNI, UNI_TO_ASCII
 
 
+_WORD_SEPARATORS = re.compile(" |\n")
+
+
 def get_fixed_length_str(
     obj: str,
     length: int,
@@ -474,12 +478,51 @@ def format_input_to_multiline_str(
         The input string, formatted with linebreaks at the required
         positions.
     """
+    return "\n".join(
+        format_input_to_multiline_list(
+            input_str,
+            max_line_length=max_line_length,
+            pad_to_max_length=pad_to_max_length,
+            keep_linebreaks=keep_linebreaks,
+        )
+    )
+
+
+def format_input_to_multiline_list(
+    input_str: str,
+    max_line_length: int = 60,
+    pad_to_max_length: bool = False,
+    keep_linebreaks: bool = True,
+) -> list[str]:
+    """
+    Format an input string into a list of lines with a limited maximum length.
+
+    This function is the line-based counterpart of format_input_to_multiline_str
+    and allows callers to use the number of lines without re-scanning the
+    formatted string.
+
+    Parameters
+    ----------
+    input_str : str
+        The input string
+    max_line_length : int, optional
+        The maximum length of each line in characters. The default is 60.
+    pad_to_max_length : bool, optional
+        Flag to toggle padding of each line to the maximum line length.
+        If False, no padding is added. The default is False.
+    keep_linebreaks : bool, optional
+        Flag to keep linebreaks in the final formatting. The default is True.
+
+    Returns
+    -------
+    list[str]
+        The individual lines of the formatted input string.
+    """
     if keep_linebreaks:
         _result_lines = []
-        _tmp_lines = input_str.split("\n")
-        for _curr_line in _tmp_lines:
+        for _curr_line in input_str.split("\n"):
             _result_lines.extend(_get_unformatted_lines(_curr_line, max_line_length))
-    if not keep_linebreaks:
+    else:
         _result_lines = _get_unformatted_lines(input_str, max_line_length)
     if pad_to_max_length:
         for _index, _item in enumerate(_result_lines):
@@ -487,7 +530,7 @@ def format_input_to_multiline_str(
             _delta_front = _delta // 2
             _delta_back = _delta // 2 + _delta % 2
             _result_lines[_index] = " " * _delta_front + _item + " " * _delta_back
-    return "\n".join(_result_lines)
+    return _result_lines
 
 
 def _get_unformatted_lines(input_str: str, max_line_length: int = 60) -> list:
@@ -506,7 +549,7 @@ def _get_unformatted_lines(input_str: str, max_line_length: int = 60) -> list:
     result_lines : list
         The list with the individual lines.
     """
-    _words = [s for s in re.split(" |\n", input_str) if len(s) > 0]
+    _words = [s for s in _WORD_SEPARATORS.split(input_str) if len(s) > 0]
     _result_lines = []
     _current_str = _words.pop(0) if len(_words) > 0 else ""
     while len(_words) > 0:
@@ -207,7 +207,6 @@ class DefineScanFrame(BaseFrame):
         )
         if len(_fnames) > 0:
             _return = ScanIo.check_multiple_files(_fnames, scan=SCAN)
-            print("Return:", _return)
             if _return[0] == "::no_error::":
                 _return = ScanIo.import_from_multiple_files(_fnames, scan=SCAN)
             elif _return[0] == "::multiple_motors::":
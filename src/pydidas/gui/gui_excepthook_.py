@@ -31,7 +31,6 @@ __all__ = ["gui_excepthook"]
 import os
 import time
 import traceback
-from io import StringIO
 
 from pydidas.core import FileReadError, UserConfigError
 from pydidas.core.utils import get_logging_dir
@@ -69,17 +68,14 @@ def gui_excepthook(exc_type, exception, trace):
         _app.sig_gui_exception_occurred.emit()
         _ = PydidasExceptionMessageBox(text=_exc_repr, title=_title).exec_()
         return
-    with StringIO() as _tmpfile:
-        traceback.print_tb(trace, None, _tmpfile)
-        _tmpfile.seek(0)
-        _trace = _tmpfile.read()
+    _trace = "".join(traceback.format_tb(trace))
 
     _time = time.strftime("%Y-%m-%d %H:%M:%S")
     _sep = "\n" + "-" * 20 + "\n"
     _msg = "-" * 20 + "\n" + _sep.join([_time, f"{exc_type}: {exception}", _trace])
 
     _logfile = os.path.join(get_logging_dir(), "pydidas_exception.log")
-    with open(_logfile, "a+") as _file:
+    with open(_logfile, "a") as _file:
         _file.write("\n\n" + _msg)
 
     _app.sig_gui_exception_occurred.emit()
@@ -27,6 +27,8 @@ __status__ = "Production"
 __all__ = ["BaseFitPlugin"]
 
 
+from typing import Optional
+
 import numpy as np
 from qtpy import QtWidgets
 from scipy.optimize import least_squares
@@ -58,12 +60,17 @@ class BaseFitPlugin(ProcPlugin):
         "fit_upper_limit",
         "fit_sigma_threshold",
         "fit_min_peak_height",
+        "fit_tolerance",
     )
     input_data_dim = -1
     output_data_dim = -1
     num_peaks = 1
     new_dataset = True
-    advanced_parameters = ["fit_sigma_threshold", "fit_min_peak_height"]
+    advanced_parameters = [
+        "fit_sigma_threshold",
+        "fit_min_peak_height",
+        "fit_tolerance",
+    ]
     has_unique_parameter_config_widget = True
 
     def __init__(self, *args: tuple, **kwargs: dict):
@@ -78,6 +85,7 @@ class BaseFitPlugin(ProcPlugin):
             "range_slice": None,
             "settings_updated_from_data": False,
             "data_x_hash": -1,
+            "bounds": None,
         }
 
     @property
@@ -109,14 +117,19 @@ class BaseFitPlugin(ProcPlugin):
         Set up the required functions and fit variable labels.
         """
         self._fitter = FitFuncMeta.get_fitter(self.get_param_value("fit_func"))
+        self._config["jacobian"] = (
+            self._fitter.jacobian if self._fitter.has_analytic_jacobian else "2-point"
+        )
         self._config["range_slice"] = None
         self._config["settings_updated_from_data"] = False
         self._config["min_peak_height"] = self.get_param_value("fit_min_peak_height")
         self._config["sigma_threshold"] = self.get_param_value("fit_sigma_threshold")
+        self._config["tolerance"] = self.get_param_value("fit_tolerance")
         self._config["result_shape"] = (self.num_peaks, len(self.fit_outputs))
         for _key in ["param_bounds_low", "param_bounds_high", "param_labels"]:
             self._config[_key] = getattr(self._fitter, _key).copy()
         _bg_order = self.get_param_value("fit_bg_order")
+        self._config["bg_order"] = _bg_order
         self.output_data_label = self.get_param_value("fit_output")
         self.output_data_unit = ""
         if _bg_order in [0, 1]:
@@ -160,21 +173,19 @@ class BaseFitPlugin(ProcPlugin):
         _startguess = self._fitter.guess_fit_start_params(
             self._data_x,
             self._data,
-            bg_order=self.get_param_value("fit_bg_order"),
-            bounds=(
-                self._config["param_bounds_low"],
-                self._config["param_bounds_high"],
-            ),
+            bg_order=self._config["bg_order"],
+            bounds=self._config["bounds"],
             **self._fit_presets,
         )
         _res = least_squares(
             self._fitter.delta,
             _startguess,
+            jac=self._config["jacobian"],
             args=(self._data_x, self._data.array),
-            bounds=(
-                self._config["param_bounds_low"],
-                self._config["param_bounds_high"],
-            ),
+            bounds=self._config["bounds"],
+            ftol=self._config["tolerance"],
+            xtol=self._config["tolerance"],
+            gtol=self._config["tolerance"],
         )
         _res_c = self._fitter.sort_fitted_peaks_by_position(tuple(_res.x))
         self._fit_params = dict(zip(self._config["param_labels"], _res_c))
@@ -182,12 +193,14 @@ class BaseFitPlugin(ProcPlugin):
             "fit_params": self._fit_params,
             "fit_func": self._fitter.name,
         }
-        _results = self.create_result_dataset()
+        _results = self.create_result_dataset(fit_delta=_res.fun)
         if kwargs.get("store_details", False):
             self._details = {None: self.create_detailed_results(_results, _startguess)}
         return _results, kwargs
 
-    def create_result_dataset(self, valid: bool = True) -> Dataset:
+    def create_result_dataset(
+        self, valid: bool = True, fit_delta: Optional[np.ndarray] = None
+    ) -> Dataset:
         """
         Create new Dataset for detailed results from the original data and the fit.
 
@@ -199,6 +212,10 @@ class BaseFitPlugin(ProcPlugin):
         ----------
         valid : bool, optional
             Flat to confirm the results are valid. The default is True.
+        fit_delta : np.ndarray, optional
+            The difference between the fit and the data, as returned by the
+            fit function's delta method. If None, it will be calculated from
+            the fit parameters. The default is None.
 
         Returns
         -------
@@ -208,10 +225,13 @@ class BaseFitPlugin(ProcPlugin):
         _new_data = np.full(self._config["result_shape"], np.nan)
         if valid and self.check_center_positions():
             _fit_pvals = tuple(self._fit_params.values())
-            _datafit = self._fitter.profile(_fit_pvals, self._data_x)
-            _residual = abs(np.std(self._data - _datafit) / np.mean(self._data))
+            if fit_delta is None:
+                fit_delta = self._fitter.delta(
+                    _fit_pvals, self._data_x, self._data.array
+                )
+            _residual = abs(np.std(fit_delta) / np.mean(self._data.array))
             if _residual <= self._config["sigma_threshold"]:
-                _new_data = self._write_valid_results(_new_data)
+                _new_data = self._write_valid_results(_new_data, _fit_pvals)
         else:  # results not valid
             _residual = np.nan
         if self.num_peaks == 1:
@@ -235,29 +255,32 @@ class BaseFitPlugin(ProcPlugin):
         }
         return _result_dataset
 
-    def _write_valid_results(self, results: np.ndarray):
+    def _write_valid_results(
+        self, results: np.ndarray, fit_param_values: tuple[float]
+    ) -> np.ndarray:
         """
         Write the valid results for the fit in the new data array.
 
         Parameters
         ----------
-        new_data : np.ndarray
+        results : np.ndarray
             The new data array.
+        fit_param_values : tuple[float]
+            The values of the fitted parameters.
 
         Returns
         -------
         np.ndarray
             The new data array with the results.
         """
-        _fit_pvals = tuple(self._fit_params.values())
         for _i, _key in enumerate(self.fit_outputs):
             if _key in ["position", "amplitude", "area", "FWHM", "background"]:
                 _attr = getattr(self._fitter, _key.lower())
-                results[slice(None), _i] = _attr(_fit_pvals)
+                results[slice(None), _i] = _attr(fit_param_values)
             if _key == "total count intensity":
                 _dx = self._data.axis_ranges[0][1] - self._data.axis_ranges[0][0]
                 results[slice(None), _i] = [
-                    a / _dx for a in self._fitter.area(_fit_pvals)
+                    a / _dx for a in self._fitter.area(fit_param_values)
                 ]
         return results
 
@@ -291,6 +314,10 @@ class BaseFitPlugin(ProcPlugin):
         if not self._config["settings_updated_from_data"]:
             self._update_node_output_labels()
             self._update_peak_bounds_from_data()
+            self._config["bounds"] = (
+                np.asarray(self._config["param_bounds_low"], dtype=float),
+                np.asarray(self._config["param_bounds_high"], dtype=float),
+            )
             self._config["settings_updated_from_data"] = True
 
     def _crop_data_to_selected_range(self):
@@ -311,32 +338,34 @@ class BaseFitPlugin(ProcPlugin):
         slice
             The slice object to crop the data to the given range.
         """
+        _x_hash = hash(self._data_x.tobytes())
         if (
-            hash(self._data_x.tobytes()) != self._config["data_x_hash"]
+            _x_hash != self._config["data_x_hash"]
             or self._config["range_slice"] is None
         ):
             _xlow = self.get_param_value("fit_lower_limit")
             _xhigh = self.get_param_value("fit_upper_limit")
-            self._config["data_x_hash"] = hash(self._data_x.tobytes())
-            _range_low = (
-                np.where((self._data_x >= _xlow))[0]
-                if _xlow is not None
-                else np.arange(self._data_x.size)
-            )
-            _range_high = (
-                np.where((self._data_x <= _xhigh))[0]
-                if _xhigh is not None
-                else np.arange(self._data_x.size)
+            self._config["data_x_hash"] = _x_hash
+            # The x-axis is monotonic, but it can be given in descending order:
+            _n_points = self._data_x.size
+            _descending = _n_points > 1 and self._data_x[0] > self._data_x[-1]
+            _x = self._data_x[::-1] if _descending else self._data_x
+            _i_low = 0 if _xlow is None else np.searchsorted(_x, _xlow, side="left")
+            _i_high = (
+                _n_points
+                if _xhigh is None
+                else np.searchsorted(_x, _xhigh, side="right")
             )
-            _range = np.intersect1d(_range_low, _range_high)
-            if _range.size < 5:
+            if _descending:
+                _i_low, _i_high = _n_points - _i_high, _n_points - _i_low
+            if _i_high - _i_low < 5:
                 raise UserConfigError(
                     "The data range for the fit is too small with less than 5 data "
                     "points. Please control the selected data range in the "
                     "FitSinglePeak plugin. The input data range is "
                     f"[{self._data_x[0]:.5f}, {self._data_x[-1]:.5f}]."
                 )
-            self._config["range_slice"] = slice(_range[0], _range[-1] + 1)
+            self._config["range_slice"] = slice(int(_i_low), int(_i_high))
         return self._config["range_slice"]
 
     def _update_node_output_labels(self):
@@ -425,7 +454,7 @@ class BaseFitPlugin(ProcPlugin):
         _min_peak = self._config["min_peak_height"]
         if _min_peak is not None:
             _tmp_y, bg_params = self._fitter.estimate_background_params(
-                self._data_x, self._data, self.get_param_value("fit_bg_order")
+                self._data_x, self._data, self._config["bg_order"]
             )
             if np.amax(_tmp_y) < _min_peak:
                 self._details = {
@@ -475,7 +504,10 @@ class BaseFitPlugin(ProcPlugin):
         }
         _datafit = Dataset(self._fitter.profile(_fit_param_vals, _xfit), **_dset_kws)
         _startfit = Dataset(self._fitter.profile(start_fit_params, _xfit), **_dset_kws)
-        _residual = self._fitter.delta(_fit_param_vals, self._data_x, self._data)
+        _residual = Dataset(
+            self._fitter.delta(_fit_param_vals, self._data_x, self._data.array),
+            **(_dset_kws | {"axis_ranges": [self._data_x]}),
+        )
 
         _details = {
             "n_plots": 3,
@@ -505,11 +537,10 @@ class BaseFitPlugin(ProcPlugin):
                 {"plot": 2, "label": "starting guess", "data": _startfit},
             ],
         }
-        if self.get_param_value("fit_bg_order") is not None:
-            _bg_poly = [self._fit_params["background_p0"]]
-            if "background_p1" in self._fit_params:
-                _bg_poly.insert(0, self._fit_params["background_p1"])
-            _bg = Dataset(np.polyval(_bg_poly, _xfit), **_dset_kws)
+        if self._config["bg_order"] is not None:
+            _bg = Dataset(
+                self._fitter.calculate_background(_fit_param_vals, _xfit), **_dset_kws
+            )
             _details["items"].append({"plot": 0, "label": "background", "data": _bg})
         return _details
 
@@ -28,15 +28,16 @@ __status__ = "Production"
 __all__ = ["pyFAIintegrationBase"]
 
 
+import math
 import multiprocessing as mp
 import os
 import pathlib
+import stat
 from typing import Literal, Optional, Union
 
 import numpy as np
 from pyFAI.azimuthalIntegrator import AzimuthalIntegrator
 from qtpy import QtWidgets
-from silx.opencl.common import OpenCL
 
 from pydidas.contexts import DiffractionExperimentContext
 from pydidas.core import UserConfigError, get_generic_param_collection
@@ -55,10 +56,34 @@ from pydidas.plugins.base_proc_plugin import ProcPlugin
 logger = pydidas_logger()
 
 
-OCL = OpenCL()
-
 PI_STR = ASCII_TO_UNI["pi"]
 
+_DEG2RAD = math.pi / 180
+_RAD2DEG = 180 / math.pi
+_EMPTY_PATH = pathlib.Path()
+_OCL_PLATFORMS = None
+
+
+def _get_ocl_platforms() -> dict:
+    """
+    Get the available OpenCL platforms, referenced by their names.
+
+    The platforms are only queried on the first call and cached afterwards.
+
+    Returns
+    -------
+    dict
+        The dictionary with the platform names as keys and the platforms
+        as values.
+    """
+    global _OCL_PLATFORMS
+    if _OCL_PLATFORMS is None:
+        from silx.opencl.common import ocl
+
+        _platforms = [] if ocl is None else ocl.platforms
+        _OCL_PLATFORMS = {_platform.name: _platform for _platform in _platforms}
+    return _OCL_PLATFORMS
+
 
 class pyFAIintegrationBase(ProcPlugin):
     """
@@ -97,6 +122,7 @@ class pyFAIintegrationBase(ProcPlugin):
         self._ai_params = {}
         self._exp_hash = -1
         self._mask = None
+        self._mask_file_state = None
         self._config["custom_mask"] = False
 
     def pre_execute(self):
@@ -128,19 +154,30 @@ class pyFAIintegrationBase(ProcPlugin):
 
         If defined (and the file exists), the locally defined detector mask
         Parameter will be used. If not, the global QSetting detector mask
-        will be used.
+        will be used. A previously loaded mask is re-used if the mask file
+        has not been modified since.
         """
-        self._mask = None
         _mask_file = self._EXP.get_param_value("detector_mask_file")
-        if _mask_file != pathlib.Path():
-            if os.path.isfile(_mask_file):
-                self._mask = import_data(_mask_file)
-            else:
-                raise UserConfigError(
-                    f"Cannot load detector mask: No file with the name \n{_mask_file}"
-                    "\nexists."
-                )
-            self._check_mask_shape()
+        if _mask_file == _EMPTY_PATH:
+            self._mask = None
+            self._mask_file_state = None
+            return
+        try:
+            _stat = os.stat(_mask_file)
+        except OSError:
+            _stat = None
+        if _stat is None or not stat.S_ISREG(_stat.st_mode):
+            self._mask = None
+            self._mask_file_state = None
+            raise UserConfigError(
+                f"Cannot load detector mask: No file with the name \n{_mask_file}"
+                "\nexists."
+            )
+        _state = (_mask_file, _stat.st_mtime_ns)
+        if self._mask is None or _state != self._mask_file_state:
+            self._mask = import_data(_mask_file)
+            self._mask_file_state = _state
+        self._check_mask_shape()
 
     def _prepare_pyfai_method(self):
         """
@@ -152,10 +189,10 @@ class pyFAIintegrationBase(ProcPlugin):
         if _method[2] != "opencl":
             return
         _name = mp.current_process().name
-        _platforms = [_platform.name for _platform in OCL.platforms]
+        _platforms = _get_ocl_platforms()
         if "NVIDIA CUDA" in _platforms and _name.startswith("pydidas_"):
             _index = int(_name.split("-")[1])
-            _platform = OCL.get_platform("NVIDIA CUDA")
+            _platform = _platforms["NVIDIA CUDA"]
             _n_device = len(_platform.devices)
             _device = _index % _n_device
             _method = _method + ((_platform.id, _device),)
@@ -177,7 +214,7 @@ class pyFAIintegrationBase(ProcPlugin):
         _range = self.get_azimuthal_range_native()
         if _range is not None:
             if "deg" in self.get_param_value("azi_unit"):
-                _range = (np.pi / 180 * _range[0], np.pi / 180 * _range[1])
+                _range = (_DEG2RAD * _range[0], _DEG2RAD * _range[1])
         return _range
 
     def get_azimuthal_range_in_deg(self) -> Union[None, tuple[float, float]]:
@@ -196,7 +233,7 @@ class pyFAIintegrationBase(ProcPlugin):
         _range = self.get_azimuthal_range_native()
         if _range is not None:
             if "rad" in self.get_param_value("azi_unit"):
-                _range = (180 / np.pi * _range[0], 180 / np.pi * _range[1])
+                _range = (_RAD2DEG * _range[0], _RAD2DEG * _range[1])
         return _range
 
     def get_azimuthal_range_native(self) -> tuple[float, float]:
@@ -222,10 +259,7 @@ class pyFAIintegrationBase(ProcPlugin):
             _low = self.get_param_value("azi_range_lower")
             _high = self.get_param_value("azi_range_upper")
             if _low < _high:
-                return (
-                    self.get_param_value("azi_range_lower"),
-                    self.get_param_value("azi_range_upper"),
-                )
+                return (_low, _high)
         return _default
 
     def _adjust_integration_discontinuity(self):
@@ -257,7 +291,7 @@ class pyFAIintegrationBase(ProcPlugin):
         """
         Try to modulate the azimuthal range to be compatible with pyFAI.
         """
-        _factor = 1 if "rad" in self.get_param_value("azi_unit") else np.pi / 180
+        _factor = 1 if "rad" in self.get_param_value("azi_unit") else _DEG2RAD
         _lower = _factor * self.get_param_value("azi_range_lower")
         _upper = _factor * self.get_param_value("azi_range_upper")
         if _upper - _lower > 2 * np.pi:
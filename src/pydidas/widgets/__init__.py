@@ -27,19 +27,8 @@ __maintainer__ = "Malte Storm"
 __status__ = "Production"
 
 
-from . import (
-    controllers,
-    dialogues,
-    factory,
-    framework,
-    misc,
-    parameter_config,
-    plugin_config_widgets,
-    selection,
-    silx_plot,
-    windows,
-    workflow_edit,
-)
+import importlib as __importlib
+
 from .factory import CreateWidgetsMixIn
 from .file_dialog import *
 from .scroll_area import *
@@ -69,3 +58,39 @@ __all__ = [
 
 # Clean up the namespace:
 del file_dialog, scroll_area, utilities, widget_with_parameter_collection
+
+
+# The sub-packages are only imported on first access to defer importing the
+# plotting libraries (silx, matplotlib) until they are actually required.
+_LAZY_SUBPACKAGES = frozenset(
+    [
+        "controllers",
+        "dialogues",
+        "framework",
+        "misc",
+        "parameter_config",
+        "plugin_config_widgets",
+        "selection",
+        "silx_plot",
+        "windows",
+        "workflow_edit",
+    ]
+)
+
+
+def __getattr__(name: str) -> object:
+    """
+    Import the requested sub-package on first access.
+    """
+    if name in _LAZY_SUBPACKAGES:
+        _module = __importlib.import_module(f".{name}", __name__)
+        globals()[name] = _module
+        return _module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """
+    Get the module attributes, including the not yet imported sub-packages.
+    """
+    return sorted(set(globals()) | _LAZY_SUBPACKAGES)
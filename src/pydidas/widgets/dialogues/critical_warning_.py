@@ -33,6 +33,9 @@ from qtpy import QtWidgets
 from pydidas.widgets.utilities import get_pyqt_icon_from_str
 
 
+_CRITICAL_ICON = None
+
+
 def critical_warning(title: str, text: str):
     """
     Create a QMessageBox with a critical warning and show it.
@@ -44,6 +47,9 @@ def critical_warning(title: str, text: str):
     text : str
         The warning message text.
     """
+    global _CRITICAL_ICON
+    if _CRITICAL_ICON is None:
+        _CRITICAL_ICON = get_pyqt_icon_from_str("qt-std::SP_MessageBoxCritical")
     _box = QtWidgets.QMessageBox(QtWidgets.QMessageBox.Critical, title, text)
-    _box.setWindowIcon(get_pyqt_icon_from_str("qt-std::SP_MessageBoxCritical"))
+    _box.setWindowIcon(_CRITICAL_ICON)
     _box.exec_()
@@ -28,19 +28,58 @@ __status__ = "Production"
 __all__ = ["PydidasExceptionMessageBox"]
 
 
-from qtpy import QtCore, QtWidgets
+from functools import lru_cache
+
+from qtpy import QtCore, QtGui, QtWidgets
 
 from pydidas.core.constants import (
     FONT_METRIC_SMALL_BUTTON_WIDTH,
     FONT_METRIC_WIDE_CONFIG_WIDTH,
     POLICY_EXP_EXP,
 )
-from pydidas.core.utils import format_input_to_multiline_str
+from pydidas.core.utils import format_input_to_multiline_list
 from pydidas.resources import icons, logos
 from pydidas.widgets.factory import CreateWidgetsMixIn
 from pydidas.widgets.scroll_area import ScrollArea
 
 
+_ERROR_ICON = None
+
+
+@lru_cache(maxsize=64)
+def _format_message_text(text: str) -> tuple[str, int]:
+    """
+    Get the formatted message text and its number of lines.
+
+    Parameters
+    ----------
+    text : str
+        The input text.
+
+    Returns
+    -------
+    tuple[str, int]
+        The formatted text and the number of lines.
+    """
+    _lines = format_input_to_multiline_list(text, max_line_length=60)
+    return "\n".join(_lines), len(_lines)
+
+
+def _get_error_icon() -> QtGui.QIcon:
+    """
+    Get the pydidas error icon, which is only loaded once.
+
+    Returns
+    -------
+    QtGui.QIcon
+        The pydidas error icon with background.
+    """
+    global _ERROR_ICON
+    if _ERROR_ICON is None:
+        _ERROR_ICON = icons.pydidas_error_icon_with_bg()
+    return _ERROR_ICON
+
+
 class PydidasExceptionMessageBox(QtWidgets.QDialog, CreateWidgetsMixIn):
     """
     Show a dialogue box with exception information.
@@ -65,7 +104,7 @@ class PydidasExceptionMessageBox(QtWidgets.QDialog, CreateWidgetsMixIn):
         QtWidgets.QDialog.__init__(self, *args, **kwargs)
         CreateWidgetsMixIn.__init__(self)
         self.setWindowTitle(_title)
-        self.setWindowIcon(icons.pydidas_error_icon_with_bg())
+        self.setWindowIcon(_get_error_icon())
         _layout = QtWidgets.QGridLayout()
         self.setLayout(_layout)
         self.create_label(
@@ -117,6 +156,6 @@ class PydidasExceptionMessageBox(QtWidgets.QDialog, CreateWidgetsMixIn):
         text : str
             The text to be displayed.
         """
-        _new_text = format_input_to_multiline_str(text, max_line_length=60)
-        self._widgets["label"].font_metric_height_factor = _new_text.count("\n") + 1
+        _new_text, _n_lines = _format_message_text(text)
+        self._widgets["label"].font_metric_height_factor = _n_lines
         self._widgets["label"].setText(_new_text)
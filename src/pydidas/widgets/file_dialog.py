@@ -110,6 +110,10 @@ class PydidasFileDialogWidget(
         """Set the basic configuration for the widget."""
         self.setViewMode(QtWidgets.QFileDialog.Detail)
         self.setOption(QtWidgets.QFileDialog.DontUseNativeDialog)
+        # Skip the per-entry icon lookups and symlink resolution which are
+        # very slow on network file systems:
+        self.setOption(QtWidgets.QFileDialog.DontUseCustomDirectoryIcons)
+        self.setOption(QtWidgets.QFileDialog.DontResolveSymlinks)
         self.setSidebarUrls(
             [
                 QtCore.QUrl("file:"),
@@ -50,6 +50,8 @@ FLOAT_VALIDATOR = QtGui.QDoubleValidator()
 FLOAT_VALIDATOR.setNotation(QtGui.QDoubleValidator.ScientificNotation)
 FLOAT_VALIDATOR.setLocale(LOCAL_SETTINGS)
 
+INT_VALIDATOR = QtGui.QIntValidator()
+
 
 _TYPE_STRINGS = {
     "true": True,
@@ -64,6 +66,12 @@ _TYPE_CONVERTERS = {
     Hdf5key: Hdf5key,
     ndarray: NumpyParser,
 }
+_VALIDATORS = {
+    (numbers.Integral, True): QT_REG_EXP_INT_VALIDATOR,
+    (numbers.Integral, False): INT_VALIDATOR,
+    (numbers.Real, True): QT_REG_EXP_FLOAT_VALIDATOR,
+    (numbers.Real, False): FLOAT_VALIDATOR,
+}
 
 
 class BaseParamIoWidgetMixIn:
@@ -83,6 +91,11 @@ class BaseParamIoWidgetMixIn:
     def __init__(self, param: Parameter, **kwargs: dict):
         self._ptype = param.dtype
         self._allow_None = param.allow_None
+        self._converter = _TYPE_CONVERTERS.get(param.dtype, None)
+        self._empty_str_is_None = self._allow_None and self._ptype in (
+            numbers.Integral,
+            numbers.Real,
+        )
         self._old_value = None
         self.__hint_factor = 1 + int(kwargs.get("linebreak", False))
 
@@ -106,16 +119,9 @@ class BaseParamIoWidgetMixIn:
         param : pydidas.core.Parameter
             The associated Parameter.
         """
-        if param.dtype == numbers.Integral:
-            if param.allow_None:
-                self.setValidator(QT_REG_EXP_INT_VALIDATOR)
-            else:
-                self.setValidator(QtGui.QIntValidator())
-        elif param.dtype == numbers.Real:
-            if param.allow_None:
-                self.setValidator(QT_REG_EXP_FLOAT_VALIDATOR)
-            else:
-                self.setValidator(FLOAT_VALIDATOR)
+        _validator = _VALIDATORS.get((param.dtype, param.allow_None), None)
+        if _validator is not None:
+            self.setValidator(_validator)
 
     def get_value_from_text(self, text: str) -> object:
         """
@@ -134,22 +140,19 @@ class BaseParamIoWidgetMixIn:
         """
         # need to process True and False explicitly because bool is a subtype
         # of int but the strings 'True' and 'False' cannot be converted to int
-        if text.lower() in _TYPE_STRINGS:
-            return _TYPE_STRINGS[text.lower()]
+        _lower_text = text.lower()
+        if _lower_text in _TYPE_STRINGS:
+            return _TYPE_STRINGS[_lower_text]
+        if text == "" and self._empty_str_is_None:
+            return None
+        if self._converter is None:
+            return text
         try:
-            if (
-                text == ""
-                and self._allow_None
-                and self._ptype in [numbers.Integral, numbers.Real]
-            ):
-                return None
-            if self._ptype in _TYPE_CONVERTERS:
-                return _TYPE_CONVERTERS[self._ptype](text)
+            return self._converter(text)
         except ValueError as _error:
             _msg = str(_error)
             _msg = _msg[0].upper() + _msg[1:]
             raise UserConfigError(f'ValueError! {_msg} Input text was "{text}"')
-        return text
 
     def emit_signal(self):
         """
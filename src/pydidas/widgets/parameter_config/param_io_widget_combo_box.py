@@ -63,14 +63,27 @@ class ParamIoWidgetComboBox(BaseParamIoWidgetMixIn, PydidasComboBox):
         """
         PydidasComboBox.__init__(self)
         BaseParamIoWidgetMixIn.__init__(self, param, **kwargs)
-        for choice in param.choices:
-            self.addItem(f"{convert_special_chars_to_unicode(str(choice))}")
-
-        self.__items = [self.itemText(i) for i in range(self.count())]
+        self.__set_items(param.choices)
         self.currentIndexChanged.connect(self.emit_signal)
         self.set_value(param.value)
         self.view().setMinimumWidth(get_max_pixel_width_of_entries(self.__items) + 50)
 
+    def __set_items(self, choices: Iterable[object, ...]):
+        """
+        Set the combobox items from the given choices.
+
+        Parameters
+        ----------
+        choices : collections.abc.Iterable
+            The choices to be displayed.
+        """
+        self.__items = [
+            convert_special_chars_to_unicode(str(_choice)) for _choice in choices
+        ]
+        self.__has_true = "True" in self.__items
+        self.__has_false = "False" in self.__items
+        self.addItems(self.__items)
+
     def __convert_bool(self, value: object) -> object:
         """
         Convert boolean integers to string.
@@ -89,9 +102,9 @@ class ParamIoWidgetComboBox(BaseParamIoWidgetMixIn, PydidasComboBox):
             The input value, with 0/1 converted it True or False are
             widget choices.
         """
-        if value == 0 and "False" in self.__items:
+        if value == 0 and self.__has_false:
             value = "False"
-        elif value == 1 and "True" in self.__items:
+        elif value == 1 and self.__has_true:
             value = "True"
         return value
 
@@ -151,10 +164,7 @@ class ParamIoWidgetComboBox(BaseParamIoWidgetMixIn, PydidasComboBox):
         """
         with QtCore.QSignalBlocker(self):
             self.clear()
-            for choice in new_choices:
-                _itemstr = convert_special_chars_to_unicode(str(choice))
-                self.addItem(_itemstr)
-            self.__items = [self.itemText(i) for i in range(self.count())]
+            self.__set_items(new_choices)
             self.set_value(new_choices[0])
             self.emit_signal()
         self.view().setMinimumWidth(get_max_pixel_width_of_entries(self.__items) + 50)
@@ -82,7 +82,6 @@ class ParamIoWidgetFile(ParamIoWidgetWithButton):
                 self.io_dialog_call = self.io_dialog.get_existing_filename
         self._io_dialog_config = {
             "reference": id(self),
-            "formats": "All files (*.*);;" + IoManager.get_string_of_formats(),
             "qsettings_ref": kwargs.get("persistent_qsettings_ref"),
         }
 
@@ -91,8 +90,14 @@ class ParamIoWidgetFile(ParamIoWidgetWithButton):
         Open a dialogue to select a file.
 
         This method is called upon clicking the "open file" button
-        and opens a QFileDialog widget to select a filename.
-        """
+        and opens a QFileDialog widget to select a filename. The file format
+        selection is only assembled here because most widgets never open the
+        dialogue.
+        """
+        if "formats" not in self._io_dialog_config:
+            self._io_dialog_config["formats"] = (
+                "All files (*.*);;" + IoManager.get_string_of_formats()
+            )
         _result = self.io_dialog_call(**self._io_dialog_config)
         if _result is not None:
             if self._flag_pattern:
@@ -112,6 +117,8 @@ class ParamIoWidgetFile(ParamIoWidgetWithButton):
         """
         text = self._io_lineedit.text()
         _value = self.get_value_from_text(text)
+        if isinstance(_value, Path):
+            return _value
         if _value in [None, True, False, nan]:
             _value = "."
             self._io_lineedit.setText(".")
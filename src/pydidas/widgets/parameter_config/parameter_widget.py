@@ -28,7 +28,6 @@ __status__ = "Production"
 __all__ = ["ParameterWidget"]
 
 
-import html
 from pathlib import Path
 
 from qtpy import QtCore
@@ -86,7 +85,7 @@ class ParameterWidget(EmptyWidget):
         EmptyWidget.__init__(self, **kwargs)
         self.setSizePolicy(*POLICY_EXP_FIX)
         self.layout().setSpacing(0)
-        self.setToolTip(f"<qt>{html.escape(param.tooltip)}</qt>")
+        self.setToolTip(param.html_tooltip)
 
         self.param = param
         self._widgets = {}
@@ -28,27 +28,26 @@ __status__ = "Production"
 __all__ = ["Hdf5DatasetSelector"]
 
 
+import os
 from functools import partial
-from pathlib import Path
 
+import qtpy
 from qtpy import QtCore
 
 from pydidas.core import Parameter
 from pydidas.core.constants import HDF5_EXTENSIONS
-from pydidas.core.utils import (
-    get_extension,
-    get_hdf5_populated_dataset_keys,
-    update_child_qobject,
-)
-from pydidas.widgets.utilities import (
-    get_max_pixel_width_of_entries,
-    get_pyqt_icon_from_str,
-)
+from pydidas.core.utils import get_hdf5_populated_dataset_keys, update_child_qobject
+from pydidas.widgets.utilities import get_pyqt_icon_from_str
 from pydidas.widgets.widget_with_parameter_collection import (
     WidgetWithParameterCollection,
 )
 
 
+_HDF5_EXTENSION_SET = frozenset(HDF5_EXTENSIONS)
+_CHECKED = (
+    QtCore.Qt.Checked.value if qtpy.QT_VERSION.startswith("6") else QtCore.Qt.Checked
+)
+
 DEFAULT_FILTERS = {
     "/entry/instrument/detector/detectorSpecific/": (
         '"detectorSpecific"\nkeys (Eiger detector)'
@@ -109,7 +108,7 @@ class Hdf5DatasetSelector(WidgetWithParameterCollection):
         self.add_params(DATA_DIMENSION_PARAM.copy(), DATASET_PARAM.copy())
 
         self._config = {
-            "activeDsetFilters": [],
+            "activeDsetFilters": set(),
             "current_dataset": "",
             "current_filename": "",
             "min_datadim": 1,
@@ -120,6 +119,9 @@ class Hdf5DatasetSelector(WidgetWithParameterCollection):
                 else DEFAULT_FILTERS
             ),
         }
+        self._populate_timer = QtCore.QTimer(self)
+        self._populate_timer.setSingleShot(True)
+        self._populate_timer.setInterval(75)
         self.__create_widgets()
         self.__connect_slots()
         self._toggle_details()
@@ -135,6 +137,7 @@ class Hdf5DatasetSelector(WidgetWithParameterCollection):
             gridPos=(0, 2, 1, 1),
             icon="qt-std::SP_MessageBoxInformation",
         )
+        _n_filters = len(self._config["dsetFilters"])
         for _index, (_key, _text) in enumerate(self._config["dsetFilters"].items()):
             self.create_check_box(
                 f"check_filter_{_key}",
@@ -146,16 +149,17 @@ class Hdf5DatasetSelector(WidgetWithParameterCollection):
             self._widgets[f"check_filter_{_key}"].stateChanged.connect(
                 partial(self._toggle_filter_key, _key)
             )
+        _last_filter_row = 1 + (_n_filters - 1) // 3
         for _col in range(3):
             update_child_qobject(self, "layout", columnStretch=(_col, 10))
-            if _col in EMPTY_WIDGET_COLS[len(self._config["dsetFilters"]) % 3]:
+            if _col in EMPTY_WIDGET_COLS[_n_filters % 3]:
                 self.create_empty_widget(
-                    f"empty_{_index}",
-                    gridPos=(1 + _index // 3, _col, 1, 1),
+                    f"empty_{_col}",
+                    gridPos=(_last_filter_row, _col, 1, 1),
                     fixedHeight=5,
                 )
 
-        _row_offset = len(self._config["dsetFilters"]) // 2 + 2
+        _row_offset = _last_filter_row + 1
 
         self.create_param_widget(
             self.get_param("min_datadim"), gridPos=(_row_offset, 0, 1, 1)
@@ -180,10 +184,13 @@ class Hdf5DatasetSelector(WidgetWithParameterCollection):
         Connect all required widget slots.
 
         Filter keys are set up dynamically along with their checkbox widgets.
+        Changes of the filter settings are coalesced with a single-shot timer
+        to read the hdf5 file structure only once for a burst of changes.
         """
         self.param_widgets["min_datadim"].io_edited.connect(self.__process_min_datadim)
         self.param_widgets["dataset"].io_edited.connect(self.__select_dataset)
         self._widgets["button_inspect"].clicked.connect(self.sig_request_hdf5_browser)
+        self._populate_timer.timeout.connect(self.__populate_dataset_list)
 
     @QtCore.Slot(str)
     def __process_min_datadim(self, value: str):
@@ -196,7 +203,7 @@ class Hdf5DatasetSelector(WidgetWithParameterCollection):
             The new value of the minimum dataset dimension parameter.
         """
         self._config["min_datadim"] = 0 if value == "any" else int(value.split("=")[1])
-        self.__populate_dataset_list()
+        self._populate_timer.start()
 
     def __populate_dataset_list(self):
         """
@@ -206,22 +213,21 @@ class Hdf5DatasetSelector(WidgetWithParameterCollection):
         list of datasets according to the selected criteria. The filtered list
         is used to populate the selection drop-down menu.
         """
+        self._populate_timer.stop()
         _datasets = get_hdf5_populated_dataset_keys(
             self._config["current_filename"],
             min_dim=self._config["min_datadim"],
             ignore_keys=self._config["activeDsetFilters"],
         )
         if "/entry/data/data" in _datasets:
-            _datasets.remove("/entry/data/data")
-            _datasets.insert(0, "/entry/data/data")
+            _datasets = ["/entry/data/data"] + [
+                _key for _key in _datasets if _key != "/entry/data/data"
+            ]
         if len(_datasets) == 0:
             _datasets = [""]
-        _param_widget = self.param_widgets["dataset"]
         self.params["dataset"].update_value_and_choices(_datasets[0], _datasets)
-        _param_widget.update_choices(_datasets)
-        _param_widget.view().setMinimumWidth(
-            get_max_pixel_width_of_entries(_datasets) + 50
-        )
+        # update_choices also adjusts the view width to the new entries:
+        self.param_widgets["dataset"].update_choices(_datasets)
         self.__select_dataset()
 
     def __select_dataset(self):
@@ -239,12 +245,12 @@ class Hdf5DatasetSelector(WidgetWithParameterCollection):
         self._config["current_dataset"] = _dset
         self.sig_new_dataset_selected.emit(_dset)
 
-    def _toggle_filter_key(self, key: str):
+    def _toggle_filter_key(self, key: str, state: QtCore.Qt.CheckState):
         """
         Add or remove the filter key from the active dataset key filters.
 
         This method will add or remove the <key> which is associated with the
-        checkbox widget <widget> from the active dataset filters.
+        toggled checkbox from the active dataset filters.
         Note: This method should never be called by the user, but it is
         connected to the checkboxes which activate or deactivate the respective
         filters.
@@ -253,13 +259,14 @@ class Hdf5DatasetSelector(WidgetWithParameterCollection):
         ----------
         key : str
             The dataset filter string.
+        state : QtCore.Qt.CheckState
+            The checkbox's new state.
         """
-        _widget = self._widgets[f"check_filter_{key}"]
-        if _widget.isChecked() and key not in self._config["activeDsetFilters"]:
-            self._config["activeDsetFilters"].append(key)
-        if not _widget.isChecked() and key in self._config["activeDsetFilters"]:
-            self._config["activeDsetFilters"].remove(key)
-        self.__populate_dataset_list()
+        if state == _CHECKED:
+            self._config["activeDsetFilters"].add(key)
+        else:
+            self._config["activeDsetFilters"].discard(key)
+        self._populate_timer.start()
 
     @QtCore.Slot(str)
     def new_filename(self, filename: str):
@@ -274,10 +281,13 @@ class Hdf5DatasetSelector(WidgetWithParameterCollection):
         filename : str
             The full file system path to the new file.
         """
-        _filename = Path(filename)
-        _is_hdf5 = get_extension(_filename, lowercase=True) in HDF5_EXTENSIONS
+        if filename and filename == self._config["current_filename"]:
+            # only hdf5 filenames are stored as current_filename:
+            self.setVisible(True)
+            return
+        _is_hdf5 = os.path.splitext(filename)[1][1:] in _HDF5_EXTENSION_SET
         self.setVisible(_is_hdf5)
-        if (not _filename.is_file()) or filename == self._config["current_filename"]:
+        if not os.path.isfile(filename):
             return
         self._config["current_filename"] = filename if _is_hdf5 else ""
         self._config["current_dataset"] = ""
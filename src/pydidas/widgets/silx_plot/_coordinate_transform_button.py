@@ -27,10 +27,10 @@ __status__ = "Production"
 __all__ = ["CoordinateTransformButton"]
 
 
-from functools import partial
+from functools import lru_cache, partial
 from typing import Literal
 
-from qtpy import QtCore, QtWidgets
+from qtpy import QtCore, QtGui, QtWidgets
 from silx.gui.plot.PlotToolButtons import PlotToolButton
 
 from pydidas.contexts import DiffractionExperimentContext
@@ -44,53 +44,52 @@ CHI = ASCII_TO_UNI["chi"]
 DIFFRACTION_EXP = DiffractionExperimentContext()
 
 
+@lru_cache(maxsize=None)
+def _get_icon(filename: str) -> QtGui.QIcon:
+    """
+    Get the pydidas icon with the given filename.
+
+    The icons are loaded on first use and shared between all buttons.
+
+    Parameters
+    ----------
+    filename : str
+        The icon's filename.
+
+    Returns
+    -------
+    QtGui.QIcon
+        The icon.
+    """
+    return icons.get_pydidas_qt_icon(filename)
+
+
 class CoordinateTransformButton(PlotToolButton):
     """
     Tool button to change the coordinate system in 2d plots to use radial geometries.
     """
 
-    STATE = None
+    STATE = {
+        ("cartesian", "icon"): "silx_coordinates_xy_cartesian.png",
+        ("cartesian", "state"): "Cartesian x/y coordinates",
+        ("cartesian", "action"): "Use cartesian x / y coordinates [px]",
+        ("r_chi", "icon"): "silx_coordinates_r_chi.png",
+        ("r_chi", "state"): f"Polar r / {CHI} coordinates",
+        ("r_chi", "action"): f"Use polar r / {CHI} coordinates [mm, deg]",
+        ("2theta_chi", "icon"): "silx_coordinates_2theta_chi.png",
+        ("2theta_chi", "state"): f"Polar 2{THETA} / {CHI} coordinates",
+        ("2theta_chi", "action"): f"Use polar 2{THETA} / {CHI} coordinates [deg, deg]",
+        ("q_chi", "icon"): "silx_coordinates_q_chi.png",
+        ("q_chi", "state"): f"Polar q / {CHI} coordinates",
+        ("q_chi", "action"): f"Use polar q / {CHI} coordinates [nm^-1, deg]",
+    }
     sig_new_coordinate_system = QtCore.Signal(str)
 
     def __init__(self, parent=None, plot=None):
-        if self.STATE is None:
-            self.__set_state()
         PlotToolButton.__init__(self, parent=parent, plot=plot)
         self.__current_cs = "None"
         self.__define_actions_and_create_menu()
 
-    def __set_state(self):
-        """
-        Set the state variables for all required actions.
-        """
-        self.STATE = {}
-
-        self.STATE["cartesian", "icon"] = icons.get_pydidas_qt_icon(
-            "silx_coordinates_xy_cartesian.png"
-        )
-        self.STATE["cartesian", "state"] = "Cartesian x/y coordinates"
-        self.STATE["cartesian", "action"] = "Use cartesian x / y coordinates [px]"
-
-        self.STATE["r_chi", "icon"] = icons.get_pydidas_qt_icon(
-            "silx_coordinates_r_chi.png"
-        )
-        self.STATE["r_chi", "state"] = f"Polar r / {CHI} coordinates"
-        self.STATE["r_chi", "action"] = f"Use polar r / {CHI} coordinates [mm, deg]"
-
-        self.STATE["2theta_chi", "icon"] = icons.get_pydidas_qt_icon(
-            "silx_coordinates_2theta_chi.png"
-        )
-        self.STATE["2theta_chi", "state"] = f"Polar 2{THETA} / {CHI} coordinates"
-        self.STATE["2theta_chi", "action"] = (
-            f"Use polar 2{THETA} / {CHI} coordinates [deg, deg]"
-        )
-
-        self.STATE["q_chi", "icon"] = icons.get_pydidas_qt_icon(
-            "silx_coordinates_q_chi.png"
-        )
-        self.STATE["q_chi", "state"] = f"Polar q / {CHI} coordinates"
-        self.STATE["q_chi", "action"] = f"Use polar q / {CHI} coordinates [nm^-1, deg]"
-
     def __define_actions_and_create_menu(self):
         """
         Define the required actions and create the button menu.
@@ -122,7 +121,7 @@ class CoordinateTransformButton(PlotToolButton):
         self.setPopupMode(QtWidgets.QToolButton.InstantPopup)
 
     def _create_action(self, coordinate_system: str) -> QtWidgets.QAction:
-        _icon = self.STATE[coordinate_system, "icon"]
+        _icon = _get_icon(self.STATE[coordinate_system, "icon"])
         _text = self.STATE[coordinate_system, "action"]
         return QtWidgets.QAction(_icon, _text, self)
 
@@ -139,7 +138,7 @@ class CoordinateTransformButton(PlotToolButton):
             The descriptive name of the coordinate system.
         """
         if cs_name != self.__current_cs:
-            self.setIcon(self.STATE[cs_name, "icon"])
+            self.setIcon(_get_icon(self.STATE[cs_name, "icon"]))
             self.setToolTip(self.STATE[cs_name, "state"])
             self.sig_new_coordinate_system.emit(cs_name)
             self.__current_cs = cs_name
@@ -29,7 +29,7 @@ __all__ = ["GenericNode"]
 
 import copy
 from numbers import Integral
-from typing import List, Self, Union
+from typing import Iterator, List, Self, Union
 
 from qtpy import QtCore
 
@@ -287,6 +287,24 @@ class GenericNode:
             res += child.get_recursive_ids()
         return res
 
+    def _iter_subtree(self) -> Iterator[Self]:
+        """
+        Iterate over the node and all its descendants.
+
+        The nodes are yielded in depth-first pre-order, i.e. every node is
+        yielded before its children and the children are yielded in order.
+
+        Yields
+        ------
+        GenericNode
+            The current node in the traversal.
+        """
+        _stack = [self]
+        while _stack:
+            _node = _stack.pop()
+            yield _node
+            _stack.extend(reversed(_node._children))
+
     def delete_node_references(self, recursive: bool = True):
         """
         Delete all references to the node from its parent and children.
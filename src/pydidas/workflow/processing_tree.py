@@ -411,26 +411,19 @@ class ProcessingTree(GenericTree):
         """
         if self.root is None:
             raise UserConfigError("The ProcessingTree has no nodes.")
-        _nodes_w_results = self.get_all_nodes_with_results()
-        _shapes = [
-            _node.result_shape
-            for _node in _nodes_w_results
-            if _node.result_shape is not None
-        ]
-        if None in _shapes or self.tree_has_changed:
+        if self.tree_has_changed:
             self.reset_tree_changed_flag()
-        _shapes = {
-            _node.node_id: _node.result_shape
-            for _node in _nodes_w_results
-            if _node.plugin.output_data_dim is not None
-            and _node.result_shape is not None
-        }
-        for _id, _shape in _shapes.items():
+        _shapes = {}
+        for _node in self.get_all_nodes_with_results():
+            _shape = _node.result_shape
+            if _node.plugin.output_data_dim is None or _shape is None:
+                continue
             if -1 in _shape:
                 raise UserConfigError(
                     "Cannot determine the shape of the output for node "
-                    f"#{_id} (type {type(self.nodes[_id].plugin).__name__})."
+                    f"#{_node.node_id} (type {type(_node.plugin).__name__})."
                 )
+            _shapes[_node.node_id] = _shape
         return _shapes
 
     def get_all_nodes_with_results(self) -> list[WorkflowNode]:
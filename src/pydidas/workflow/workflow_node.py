@@ -155,7 +155,8 @@ class WorkflowNode(GenericNode):
         """
         Prepare the execution of the plugin chain.
 
-        This method recursively calls the pre_execute methods of all (child) plugins.
+        This method calls the pre_execute methods of the plugin and of all the
+        plugins in the node's branch.
 
         Parameters
         ----------
@@ -169,11 +170,10 @@ class WorkflowNode(GenericNode):
                 file system.
         """
         _test_mode = kwargs.get("test", False)
-        self.results = None
-        self.plugin.test_mode = _test_mode
-        self.plugin.pre_execute()
-        for _child in self._children:
-            _child.prepare_execution(**kwargs)
+        for _node in self._iter_subtree():
+            _node.results = None
+            _node.plugin.test_mode = _test_mode
+            _node.plugin.pre_execute()
 
     def execute_plugin(self, arg: Union[Dataset, int], **kwargs: dict):
         """
@@ -186,6 +186,31 @@ class WorkflowNode(GenericNode):
         **kwargs : dict
             Any keyword arguments which need to be passed to the plugin.
 
+        Returns
+        -------
+        results : Dataset
+            The result of the plugin.execute method.
+        kwargs : dict
+            Any keywords required for calling the next plugin.
+        """
+        return self._execute_plugin_and_store_results(arg, kwargs)
+
+    def _execute_plugin_and_store_results(
+        self, arg: Union[Dataset, int], kwargs: dict, copy_results: bool = True
+    ) -> tuple[Dataset, dict]:
+        """
+        Execute the plugin and store its results, if required.
+
+        Parameters
+        ----------
+        arg : Union[Dataset, int]
+            The argument which need to be passed to the plugin.
+        kwargs : dict
+            Any keyword arguments which need to be passed to the plugin.
+        copy_results : bool, optional
+            Flag to store a copy of the results. If False, leaf nodes store
+            the results directly. The default is True.
+
         Returns
         -------
         results : Dataset
@@ -197,16 +222,17 @@ class WorkflowNode(GenericNode):
             if kwargs.get("store_input_data", False):
                 self.plugin.store_input_data_copy(arg, **kwargs)
             _results, kwargs = self.plugin.execute(arg, **kwargs)
-        self._store_results_if_required(_results, kwargs)
+        self._store_results_if_required(_results, kwargs, copy_results)
         self.runtime = _runtime()
         return _results, kwargs
 
     def execute_plugin_chain(self, arg: Union[Dataset, int], **kwargs: dict):
         """
-        Execute the full plugin chain recursively.
+        Execute the full plugin chain.
 
         This method will call the plugin.execute method and pass the results
-        to the node's children and call their execute_plugin_chain methods.
+        to the node's children and execute their plugins as well. The nodes
+        are processed depth-first with an explicit stack to avoid recursion.
         Note: No result callback is intended. It is assumed that plugin chains
         are responsible for saving their own data at the end of the processing.
 
@@ -217,37 +243,56 @@ class WorkflowNode(GenericNode):
         **kwargs : dict
             Any keyword arguments which need to be passed to the plugin.
         """
-        with TimerSaveRuntime() as _runtime:
-            if kwargs.get("store_input_data", False):
-                self.plugin.store_input_data_copy(arg, **kwargs)
-            res, reskws = self.plugin.execute(arg, **kwargs)
-        self._store_results_if_required(res, reskws)
-        self.runtime = _runtime()
-        for _child in self._children:
-            if len(self._children) > 1:
-                _child.execute_plugin_chain(deepcopy(res), **reskws)
-            else:
-                _child.execute_plugin_chain(
-                    res, **self._get_deep_copy_of_kwargs(reskws)
-                )
-
-    def _store_results_if_required(self, results: Dataset, reskws: dict):
+        _stack = [(self, arg, kwargs, False)]
+        _pop = _stack.pop
+        _append = _stack.append
+        _extend = _stack.extend
+        _copy_kwargs = self._get_deep_copy_of_kwargs
+        while _stack:
+            _node, _arg, _kwargs, _copy_arg = _pop()
+            if _copy_arg:
+                _arg = deepcopy(_arg)
+            res, reskws = _node._execute_plugin_and_store_results(
+                _arg, _kwargs, copy_results=False
+            )
+            _children = _node._children
+            if len(_children) == 1:
+                _append((_children[0], res, _copy_kwargs(reskws), False))
+                continue
+            # children are added in reverse order to keep the depth-first order
+            # of execution. Their input data is copied only when they are
+            # executed to keep the memory footprint low. The last child is
+            # executed after all its siblings and can use the original result.
+            _extend((_child, res, reskws, False) for _child in _children[-1:])
+            _extend((_child, res, reskws, True) for _child in reversed(_children[:-1]))
+
+    def _store_results_if_required(
+        self, results: Dataset, reskws: dict, copy_results: bool = True
+    ):
         """
         Store the results of the plugin if required.
 
+        Results of nodes with children are always copied because the children
+        might modify their input data.
+
         Parameters
         ----------
         results : Dataset
             The result of the plugin execution.
         reskws : dict
             The keyword arguments as returned from the plugin execution
+        copy_results : bool, optional
+            Flag to store a copy of the results of a leaf node. The default
+            is True.
         """
         if (
-            self.is_leaf
+            not self._children
             or self.plugin.get_param_value("keep_results")
             or reskws.get("force_store_results", False)
         ) and self.plugin.output_data_dim is not None:
-            self.results = deepcopy(results)
+            self.results = (
+                deepcopy(results) if (copy_results or self._children) else results
+            )
             self.result_kws = self._get_deep_copy_of_kwargs(reskws)
 
     @staticmethod
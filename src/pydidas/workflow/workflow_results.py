@@ -43,6 +43,7 @@ from pydidas.contexts import (
     ScanContext,
 )
 from pydidas.core import Dataset, Parameter, SingletonFactory, UserConfigError, utils
+from pydidas.core.utils.dataset_utils import update_dataset_properties_from_kwargs
 from pydidas.workflow.processing_tree import ProcessingTree
 from pydidas.workflow.result_io import WorkflowResultIoMeta as ResultSaver
 from pydidas.workflow.workflow_tree import WorkflowTree
@@ -218,7 +219,7 @@ class WorkflowResults(QtCore.QObject):
             )
         if not self._config["composites_created"]:
             self._create_composites()
-        _scan_index = self._SCAN.get_index_position_in_scan(index)
+        _scan_index = np.unravel_index(index, self._config["scan_shape"])
         for _key, _val in results.items():
             self._composites[_key][_scan_index] = _val
         self.new_results.emit()
@@ -232,13 +233,16 @@ class WorkflowResults(QtCore.QObject):
                 "The shapes of the results have not been set. Please set the shapes "
                 "before storing results."
             )
+        # The composites are created as views of the new arrays because the
+        # Dataset constructor would copy the full array:
         self._composites = {
-            _key: Dataset(
-                np.full(_shape, np.nan, dtype=np.float32),
-                **self._config["plugin_res_metadata"].get(_key, {}),
+            _key: update_dataset_properties_from_kwargs(
+                np.full(_shape, np.nan, dtype=np.float32).view(Dataset),
+                self._config["plugin_res_metadata"].get(_key, {}),
             )
             for _key, _shape in self._config["shapes"].items()
         }
+        self._config["scan_shape"] = self._config["frozen_SCAN"].shape
         self._config["composites_created"] = True
 
     @property
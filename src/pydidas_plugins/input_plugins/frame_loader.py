@@ -48,6 +48,16 @@ class FrameLoader(InputPlugin):
 
     plugin_name = "Single frame loader"
 
+    def pre_execute(self):
+        """
+        Prepare loading frames from single files.
+        """
+        InputPlugin.pre_execute(self)
+        self._standard_kwargs = {
+            "roi": self._get_own_roi(),
+            "binning": self.get_param_value("binning"),
+        }
+
     def get_frame(self, frame_index: int, **kwargs: dict) -> tuple[Dataset, dict]:
         """
         Load a frame and pass it on.
@@ -68,7 +78,7 @@ class FrameLoader(InputPlugin):
             The updated calling keyword arguments.
         """
         _fname = self.get_filename(frame_index)
-        kwargs["roi"] = self._get_own_roi()
+        kwargs = kwargs | self._standard_kwargs
         _data = import_data(_fname, **kwargs)
         _data.axis_units = ["pixel", "pixel"]
         _data.axis_labels = ["detector y", "detector x"]
@@ -92,9 +92,11 @@ class Hdf5fileSeriesLoader(InputPlugin):
                 )[_slice_ax]
             )
         self.set_param_value("_counted_images_per_file", _i_per_file)
+        self._config["images_per_file"] = _i_per_file
         self._standard_kwargs = {
             "dataset": self.get_param_value("hdf5_key"),
             "binning": self.get_param_value("binning"),
+            "roi": self._get_own_roi(),
         }
         self._index_func = lambda i: (
             None if _slice_ax is None else ((None,) * _slice_ax + (i,))
@@ -120,16 +122,12 @@ class Hdf5fileSeriesLoader(InputPlugin):
             The updated kwargs for importing the frame.
         """
         _fname = self.get_filename(frame_index)
-        _hdf_index = frame_index % self.get_param_value("_counted_images_per_file")
+        _hdf_index = frame_index % self._config["images_per_file"]
         kwargs = kwargs | self._standard_kwargs
         kwargs["indices"] = self._index_func(_hdf_index)
 
         _data = import_data(
-            _fname,
-            forced_dimension=2,
-            import_pydidas_metadata=False,
-            roi=self._get_own_roi(),
-            **kwargs,
+            _fname, forced_dimension=2, import_pydidas_metadata=False, **kwargs
         )
         _data.axis_units = ["pixel", "pixel"]
         _data.axis_labels = ["detector y", "detector x"]
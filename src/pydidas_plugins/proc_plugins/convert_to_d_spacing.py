@@ -41,6 +41,11 @@ from pydidas.core.constants import PROC_PLUGIN_INTEGRATED
 from pydidas.plugins import ProcPlugin
 
 
+_RADIAL_AXES = frozenset(
+    tuple(_choice.split(" / ")) for _choice in get_generic_parameter("rad_unit").choices
+)
+
+
 class ConvertToDSpacing(ProcPlugin):
     """
     Convert Q, r or 2θ data from an integration plugin to d-spacing.
@@ -61,7 +66,6 @@ class ConvertToDSpacing(ProcPlugin):
     def pre_execute(self):
         self._lambda = self._EXP.get_param_value("xray_wavelength")
         self._detector_dist = self._EXP.get_param_value("detector_dist")
-        self._allowed_ax_choices = get_generic_parameter("rad_unit").choices
         self._config["ax_index"] = None
         self._config["new_range"] = None
         self._config["ax_indices"] = None
@@ -85,21 +89,22 @@ class ConvertToDSpacing(ProcPlugin):
             kwargs : dict
                 Any calling kwargs, appended by any changes in the function.
         """
-        _new_data = data.copy()
         if self._config["ax_index"] is None:
             self._set_ax_index(data)
         if self._config["new_range"] is None:
-            self._calculate_new_range(_new_data)
+            self._calculate_new_range(data)
         _axis = self._config["ax_index"]
+        # The slicer uses an index array for the converted axis. Therefore,
+        # slicing always returns a new Dataset and the input is not modified.
+        _new_data = data[self._slicer]
         _new_data.update_axis_unit(_axis, self._config["unit"])
-        _new_data = _new_data[self._slicer]
         _new_data.update_axis_range(_axis, self._config["new_range"])
         _new_data.update_axis_label(_axis, "d-spacing")
         return _new_data, kwargs
 
     def _set_ax_index(self, data: Dataset):
         for axis, label in data.axis_labels.items():
-            if f"{label} / {data.axis_units[axis]}" in self._allowed_ax_choices:
+            if (label, data.axis_units[axis]) in _RADIAL_AXES:
                 self._config["ax_index"] = axis
                 self._slicer = tuple(slice(None) for _ in range(axis))
                 return
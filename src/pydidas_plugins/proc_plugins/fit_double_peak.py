@@ -76,6 +76,9 @@ class FitDoublePeak(BaseFitPlugin):
     *Fit sigma rejection threshold* will be handled as failed and will return NaN
     values. Adjusting the rejection threshold will allow to modify the goodness of the
     fits to accept.
+
+    The convergence of the least squares fit is controlled by the
+    *Fit convergence tolerance*.
     """
 
     plugin_name = "Fit double peak"
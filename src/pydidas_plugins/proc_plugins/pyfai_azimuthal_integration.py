@@ -53,6 +53,7 @@ class PyFAIazimuthalIntegration(pyFAIintegrationBase):
         """
         pyFAIintegrationBase.pre_execute(self)
         self._ai_params = {
+            "npt": self.get_param_value("rad_npoint"),
             "unit": self.get_pyFAI_unit_from_param("rad_unit"),
             "radial_range": self.get_radial_range(),
             "azimuth_range": self.get_azimuthal_range_in_deg(),
@@ -88,8 +89,6 @@ class PyFAIazimuthalIntegration(pyFAIintegrationBase):
             changes in the function.
         """
         self.check_and_set_custom_mask(**kwargs)
-        _newdata = self._ai.integrate1d(
-            data, self.get_param_value("rad_npoint"), **self._ai_params
-        )
+        _newdata = self._ai.integrate1d(data, **self._ai_params)
         _dataset = Dataset(_newdata[1], axis_ranges=[_newdata[0]], **self._dataset_info)
         return _dataset, kwargs
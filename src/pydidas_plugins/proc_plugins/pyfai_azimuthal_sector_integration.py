@@ -125,6 +125,7 @@ class PyFAIazimuthalSectorIntegration(pyFAIintegrationBase):
                 _ai.set_mask(self._mask)
         self._prepare_pyfai_method()
         self._ai_params = {
+            "npt": self.get_param_value("rad_npoint"),
             "unit": self.get_pyFAI_unit_from_param("rad_unit"),
             "radial_range": self.get_radial_range(),
             "polarization_factor": self.get_param_value("polarization_factor"),
@@ -186,7 +187,6 @@ class PyFAIazimuthalSectorIntegration(pyFAIintegrationBase):
         _results = [
             _ai.integrate1d(
                 data,
-                self.get_param_value("rad_npoint"),
                 azimuth_range=self._config["sector_ranges"][_index],
                 **self._ai_params,
             )
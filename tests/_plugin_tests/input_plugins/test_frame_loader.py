@@ -110,6 +110,15 @@ class TestFrameLoader(unittest.TestCase):
             _data.shape, (plugin.get_param_value("roi_yhigh"), self._img_shape[1])
         )
 
+    def test_execute__with_binning(self):
+        plugin = PLUGIN_COLLECTION.get_plugin_by_name("FrameLoader")()
+        plugin.set_param_value("binning", 2)
+        _index = 3
+        plugin.pre_execute()
+        _data, kwargs = plugin.execute(_index)
+        self.assertTrue((_data == _index).all())
+        self.assertEqual(_data.shape, tuple(_n // 2 for _n in self._img_shape))
+
     def test_execute__get_all_frames(self):
         plugin = PLUGIN_COLLECTION.get_plugin_by_name("FrameLoader")()
         plugin.pre_execute()
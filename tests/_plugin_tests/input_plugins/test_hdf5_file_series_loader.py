@@ -98,6 +98,7 @@ class TestHdf5FileSeriesLoader(unittest.TestCase):
         plugin.pre_execute()
         self.assertIn("dataset", plugin._standard_kwargs.keys())
         self.assertIn("binning", plugin._standard_kwargs.keys())
+        self.assertIn("roi", plugin._standard_kwargs.keys())
 
     def test_pre_execute__no_images_per_file_set(self):
         plugin = self.create_plugin()
@@ -151,6 +151,19 @@ class TestConvertToDSpacing(unittest.TestCase):
         _result, _kwargs = plugin.execute(self._data[1:])
         self.assertTrue(np.allclose(_result.axis_ranges[0], self._ref["Q"]))
 
+    def test_execute__input_unchanged(self):
+        plugin = self.get_standard_plugin()
+        self._data.update_axis_label(0, "Q")
+        self._data.update_axis_unit(0, "nm^-1")
+        _input = self._data.copy()
+        plugin.pre_execute()
+        _result, _kwargs = plugin.execute(self._data)
+        _result[:] = -1
+        self.assertTrue(np.all(self._data == _input))
+        self.assertEqual(self._data.axis_labels, _input.axis_labels)
+        self.assertEqual(self._data.axis_units, _input.axis_units)
+        self.assertTrue(np.allclose(self._data.axis_ranges[0], self._range))
+
     def test_execute__missing_axis_label(self):
         plugin = self.get_standard_plugin()
         plugin.pre_execute()
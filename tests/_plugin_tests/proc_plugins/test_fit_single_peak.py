@@ -179,6 +179,19 @@ class TestFitSinglePeak(unittest.TestCase):
         self.assertTrue("test_meta" in _new_data.metadata)
         self.assertTrue(np.isnan(_new_data.array[0]))
 
+    def test_create_result_dataset__w_fit_delta(self):
+        plugin = self.create_gauss_plugin_with_dummy_fit()
+        _fit_delta = plugin._fitter.delta(
+            tuple(plugin._fit_params.values()), plugin._data_x, plugin._data.array
+        )
+        _ref_data = plugin.create_result_dataset()
+        _new_data = plugin.create_result_dataset(fit_delta=_fit_delta)
+        self.assertAlmostEqual(
+            _new_data.metadata["fit_residual_std"],
+            _ref_data.metadata["fit_residual_std"],
+        )
+        self.assertTrue(np.allclose(_new_data, _ref_data))
+
     def test_create_result_dataset__peak_pos_and_area(self):
         plugin = self.create_gauss_plugin_with_dummy_fit()
         plugin.set_param_value("fit_output", "position; area")
@@ -349,6 +362,32 @@ class TestFitSinglePeak(unittest.TestCase):
         _details = plugin.detailed_results
         self.assertEqual(set(_details.keys()), {None})
 
+    def test_detailed_results__background(self):
+        plugin = self.create_generic_plugin()
+        plugin.set_param_value("fit_bg_order", 1)
+        plugin.pre_execute()
+        _data, _kwargs = plugin.execute(self._data, store_details=True)
+        _items = plugin.detailed_results[None]["items"]
+        _bg = [_item["data"] for _item in _items if _item["label"] == "background"][0]
+        _x = _bg.axis_ranges[0]
+        _params = _kwargs["fit_params"]
+        self.assertTrue(
+            np.allclose(_bg, _params["background_p0"] + _params["background_p1"] * _x)
+        )
+
+    def test_detailed_results__residual(self):
+        plugin = self.create_generic_plugin()
+        plugin.pre_execute()
+        _data, _kwargs = plugin.execute(self._data, store_details=True)
+        _items = plugin.detailed_results[None]["items"]
+        _residual = [_item["data"] for _item in _items if _item["label"] == "residual"]
+        _fit = plugin._fitter.profile(
+            tuple(_kwargs["fit_params"].values()), plugin._data_x
+        )
+        self.assertIsInstance(_residual[0], Dataset)
+        self.assertTrue(np.allclose(_residual[0].axis_ranges[0], plugin._data_x))
+        self.assertTrue(np.allclose(_residual[0], _fit - plugin._data.array))
+
     def test_detailed_results__multidim(self):
         _data = np.tile(self._data, (3, 3, 1))
         _data.axis_labels = ("a", "b", "data")
@@ -501,6 +501,23 @@ class TestCompositeCreatorApp(unittest.TestCase):
         _binned_shape = (self._img_shape[0] // 2, self._img_shape[1] // 2)
         self.assertEqual(_mask.shape, _binned_shape)
 
+    def test_get_detector_mask__with_binning_values(self):
+        _mask = np.zeros(self._img_shape, dtype=int)
+        _mask[0, 1] = 1
+        _mask[5, 5] = 1
+        _maskfile = self._path.joinpath("binning_mask.npy")
+        np.save(_maskfile, _mask)
+        app = CompositeCreatorApp()
+        app.set_param_value("binning", 2)
+        app.set_param_value("use_detector_mask", True)
+        app.set_param_value("detector_mask_file", _maskfile)
+        app._store_detector_mask()
+        _target = np.zeros((self._img_shape[0] // 2, self._img_shape[1] // 2), bool)
+        _target[0, 0] = True
+        _target[2, 2] = True
+        self.assertEqual(app._det_mask.dtype, np.bool_)
+        self.assertTrue(np.array_equal(app._det_mask, _target))
+
     def test_get_detector_mask__with_roi(self):
         app = CompositeCreatorApp()
         app.set_param_value("roi_xlow", 5)
@@ -177,6 +177,15 @@ class TestScan(unittest.TestCase):
                 _index = SCAN.get_index_position_in_scan(_n)
                 self.assertEqual(_index, _pos)
 
+    def test_get_frame_position_in_scan__all_frames(self):
+        SCAN = Scan()
+        self.set_scan_params(SCAN)
+        SCAN.set_param_value("scan_multiplicity", 2)
+        for _n, _pos in enumerate(np.ndindex(self._scan_shape)):
+            with self.subTest(n=_n):
+                self.assertEqual(SCAN.get_frame_position_in_scan(2 * _n), _pos)
+                self.assertEqual(SCAN.get_frame_position_in_scan(2 * _n + 1), _pos)
+
     def test_get_index_of_frame(self):
         SCAN = Scan()
         self.set_scan_params(SCAN)
@@ -108,6 +108,38 @@ def test_delta(TestClass, num_peaks, bg_params):
     assert isinstance(_result, np.ndarray)
 
 
+def test_func_jacobian(TestClass):
+    with pytest.raises(NotImplementedError):
+        TestClass.func_jacobian([], x)
+
+
+@pytest.mark.parametrize("num_peaks", [1, 2])
+@pytest.mark.parametrize("bg_params", [(), (2,), (2, 4)])
+def test_jacobian(TestClass, num_peaks, bg_params):
+    TestClass.num_peak_params = 2
+    TestClass.num_peaks = num_peaks
+    TestClass.func_jacobian = staticmethod(
+        lambda c, x: np.array([c[0] * x, c[1] * np.ones(x.size)])
+    )
+    _params = ((2, 5) if num_peaks == 1 else (1.5, 3, 2, 4)) + bg_params
+    _jac = TestClass.jacobian(_params, x, y)
+    assert _jac.shape == (x.size, len(_params))
+    for _i_peak in range(num_peaks):
+        assert np.allclose(_jac[:, 2 * _i_peak], _params[2 * _i_peak] * x)
+        assert np.allclose(_jac[:, 2 * _i_peak + 1], _params[2 * _i_peak + 1])
+    if len(bg_params) > 0:
+        assert np.allclose(_jac[:, 2 * num_peaks], 1)
+    if len(bg_params) > 1:
+        assert np.allclose(_jac[:, 2 * num_peaks + 1], x)
+
+
+def test_jacobian__unsupported_bg_order(TestClass):
+    TestClass.num_peaks = 1
+    TestClass.num_peak_params = 1
+    with pytest.raises(ValueError):
+        TestClass.jacobian([0, 1, 2, 3], x, y)
+
+
 @pytest.mark.parametrize("num_peaks", [1, 2, 3])
 @pytest.mark.parametrize("amplitude_param", [0, 1, 2])
 def test_area(TestClass, num_peaks, amplitude_param):
@@ -100,6 +100,20 @@ class TestVoigt(unittest.TestCase):
         _func_values = Voigt.func(self._params, self._x)
         self.assertTrue(np.allclose(self._data, _func_values))
 
+    def test_func_jacobian(self):
+        _jac = Voigt.func_jacobian(self._params, self._x)
+        self.assertEqual(_jac.shape, (len(self._params), self._x.size))
+        for _index, _val in enumerate(self._params):
+            _delta = 1e-6 * _val
+            _params_high = list(self._params)
+            _params_high[_index] = _val + _delta
+            _params_low = list(self._params)
+            _params_low[_index] = _val - _delta
+            _numerical_derivative = (
+                Voigt.func(_params_high, self._x) - Voigt.func(_params_low, self._x)
+            ) / (2 * _delta)
+            self.assertTrue(np.allclose(_jac[_index], _numerical_derivative))
+
     def test_amplitude(self):
         _amp = Voigt.amplitude(self._params)
         self.assertAlmostEqual(np.amax(self._data), _amp, places=4)
@@ -197,6 +197,14 @@ class TestParameter(unittest.TestCase):
             obj.tooltip, "Test tooltip (unit: m, type: <class 'numpy.ndarray'>)"
         )
 
+    def test_html_tooltip(self):
+        obj = Parameter("Test0", str, "", tooltip="Test <b> & tooltip")
+        self.assertEqual(
+            obj.html_tooltip,
+            "<qt>Test &lt;b&gt; &amp; tooltip (type: str)</qt>",
+        )
+        self.assertIs(obj.html_tooltip, obj.html_tooltip)
+
     def test_choices_setter(self):
         obj = Parameter("Test0", int, 12, choices=[0, 12])
         self.assertEqual(obj.choices, [0, 12])
@@ -229,6 +229,13 @@ class Test_Hdf5_dataset_utils(unittest.TestCase):
         _res = get_hdf5_populated_dataset_keys(self._fname(1), min_dim=1, min_size=1000)
         self.assertEqual(set(_res), set(self._fulldsets))
 
+    def test_get_hdf5_populated_dataset_keys__ignore_keys_set(self):
+        _res = get_hdf5_populated_dataset_keys(
+            self._fname(1),
+            ignore_keys={"/test/path/", "/test/other/data", "/test/other/extdata"},
+        )
+        self.assertEqual(set(_res), {"/test/other/path/data"})
+
     def test_convert_data_for_writing_to_hdf5_dataset__None(self):
         _data = convert_data_for_writing_to_hdf5_dataset(None)
         self.assertEqual(_data, "::None::")
@@ -36,6 +36,7 @@ from contextlib import redirect_stdout
 from pydidas.core.utils.str_utils import (
     convert_special_chars_to_unicode,
     convert_unicode_to_ascii,
+    format_input_to_multiline_list,
     format_input_to_multiline_str,
     get_fixed_length_str,
     get_random_string,
@@ -402,6 +403,11 @@ class Test_str_utils(unittest.TestCase):
         _new = format_input_to_multiline_str(_test, keep_linebreaks=False)
         self.assertEqual(_new, "test test test test")
 
+    def test_format_input_to_multiline_list__too_long(self):
+        _test = "test test\ntest test test "
+        _new = format_input_to_multiline_list(_test, max_line_length=12)
+        self.assertEqual(_new, ["test test", "test test", "test"])
+
     def test_format_input_to_multiline_str__simple_with_padding(self):
         _test = "test test test test "
         _new = format_input_to_multiline_str(
@@ -28,7 +28,7 @@ import unittest
 
 import numpy as np
 
-from pydidas.core import Dataset, get_generic_param_collection
+from pydidas.core import Dataset, UserConfigError, get_generic_param_collection
 from pydidas.core.fitting.gaussian import Gaussian
 from pydidas.plugins import BaseFitPlugin, BasePlugin
 
@@ -104,16 +104,27 @@ class TestBaseFitPlugin(unittest.TestCase):
         plugin.pre_execute()
         self.assertEqual(plugin._config["sigma_threshold"], _sigma)
         self.assertEqual(plugin._config["min_peak_height"], _min_peak)
+        self.assertIsNone(plugin._config["bg_order"])
+        self.assertEqual(
+            plugin._config["tolerance"], plugin.get_param_value("fit_tolerance")
+        )
         self.assertEqual(plugin._config["param_labels"], Gaussian.param_labels)
         self.assertEqual(plugin._config["param_bounds_low"], Gaussian.param_bounds_low)
         self.assertEqual(
             plugin._config["param_bounds_high"], Gaussian.param_bounds_high
         )
 
+    def test_pre_execute__jacobian(self):
+        plugin = BaseFitPlugin()
+        plugin.set_param_value("fit_func", "Gaussian")
+        plugin.pre_execute()
+        self.assertEqual(plugin._config["jacobian"], Gaussian.jacobian)
+
     def test_pre_execute__bg_order_0(self):
         plugin = BaseFitPlugin()
         plugin.set_param_value("fit_bg_order", 0)
         plugin.pre_execute()
+        self.assertEqual(plugin._config["bg_order"], 0)
         self.assertTrue("background_p0" in plugin._config["param_labels"])
         self.assertEqual(len(plugin._config["param_bounds_low"]), 4)
         self.assertEqual(len(plugin._config["param_bounds_high"]), 4)
@@ -122,6 +133,7 @@ class TestBaseFitPlugin(unittest.TestCase):
         plugin = BaseFitPlugin()
         plugin.set_param_value("fit_bg_order", 1)
         plugin.pre_execute()
+        self.assertEqual(plugin._config["bg_order"], 1)
         self.assertTrue("background_p0" in plugin._config["param_labels"])
         self.assertTrue("background_p1" in plugin._config["param_labels"])
         self.assertEqual(len(plugin._config["param_bounds_low"]), 5)
@@ -143,6 +155,23 @@ class TestBaseFitPlugin(unittest.TestCase):
         self.assertTrue(np.all((self._data[24:51] == plugin._data)))
         self.assertTrue(np.all((self._x[24:51] == plugin._data_x)))
 
+    def test_prepare_input_data__w_limits_descending_x(self):
+        _data = self._data[::-1]
+        plugin = BaseFitPlugin()
+        plugin._config["settings_updated_from_data"] = True
+        plugin.set_param_value("fit_lower_limit", 12)
+        plugin.set_param_value("fit_upper_limit", 25)
+        plugin.prepare_input_data(_data)
+        self.assertTrue(np.all((_data[99:126] == plugin._data)))
+        self.assertTrue(np.all((self._x[::-1][99:126] == plugin._data_x)))
+
+    def test_prepare_input_data__range_too_small(self):
+        plugin = BaseFitPlugin()
+        plugin.set_param_value("fit_lower_limit", 12)
+        plugin.set_param_value("fit_upper_limit", 13)
+        with self.assertRaises(UserConfigError):
+            plugin.prepare_input_data(self._data)
+
     def test_update_peak_bounds_from_data(self):
         plugin = BaseFitPlugin()
         plugin.pre_execute()
@@ -150,6 +179,16 @@ class TestBaseFitPlugin(unittest.TestCase):
         self.assertEqual(plugin._config["param_bounds_low"][2], np.amin(self._x))
         self.assertEqual(plugin._config["param_bounds_high"][2], np.amax(self._x))
 
+    def test_prepare_input_data__bounds(self):
+        plugin = BaseFitPlugin()
+        plugin.pre_execute()
+        plugin.prepare_input_data(self._data)
+        _low, _high = plugin._config["bounds"]
+        self.assertIsInstance(_low, np.ndarray)
+        self.assertIsInstance(_high, np.ndarray)
+        self.assertTrue(np.allclose(_low, plugin._config["param_bounds_low"]))
+        self.assertTrue(np.allclose(_high, plugin._config["param_bounds_high"]))
+
     def test_update_peak_bounds_from_data__bounds_already_set(self):
         _low = self._x[4]
         _high = self._x[-7]
@@ -132,6 +132,12 @@ class TestPyFaiIntegrationBase(unittest.TestCase):
         plugin = pyFAIintegrationBase(rad_unit="Q / nm^-1")
         self.assertEqual(plugin.get_pyFAI_unit_from_param("rad_unit"), "q_nm^-1")
 
+    def test_get_pyFAI_unit_from_param__changed_after_pre_execute(self):
+        plugin = pyFAIintegrationBase(rad_unit="Q / nm^-1")
+        plugin.pre_execute()
+        plugin.set_param_value("rad_unit", "2theta / deg")
+        self.assertEqual(plugin.get_pyFAI_unit_from_param("rad_unit"), "2th_deg")
+
     def test_modulate_and_store_azi_range__rad_ranges_flipped(self):
         plugin = pyFAIintegrationBase(
             azi_use_range="Specify azimuthal range",
@@ -552,6 +558,26 @@ class TestPyFaiIntegrationBase(unittest.TestCase):
         plugin.load_and_set_mask()
         self.assertTrue((plugin._mask == _mask).all())
 
+    def test_load_and_set_mask__unchanged_file(self):
+        _maskfilename, _mask = self.create_mask()
+        plugin = pyFAIintegrationBase()
+        EXP.set_param_value("detector_mask_file", _maskfilename)
+        plugin.load_and_set_mask()
+        _loaded_mask = plugin._mask
+        plugin.load_and_set_mask()
+        self.assertIs(plugin._mask, _loaded_mask)
+
+    def test_load_and_set_mask__modified_file(self):
+        _maskfilename, _mask = self.create_mask()
+        plugin = pyFAIintegrationBase()
+        EXP.set_param_value("detector_mask_file", _maskfilename)
+        plugin.load_and_set_mask()
+        np.save(_maskfilename, 1 - _mask)
+        _mtime = os.stat(_maskfilename).st_mtime_ns + 10**9
+        os.utime(_maskfilename, ns=(_mtime, _mtime))
+        plugin.load_and_set_mask()
+        self.assertTrue((plugin._mask == 1 - _mask).all())
+
     def test_load_and_set_mask__wrong_size(self):
         _maskfilename, _mask = self.create_mask()
         plugin = pyFAIintegrationBase()
@@ -248,6 +248,12 @@ class TestGenericNode(unittest.TestCase):
         _ids = root.get_recursive_ids()
         self.assertEqual(_ids, [0])
 
+    def test_iter_subtree(self):
+        _nodes, _target_conns, _n_nodes = self.create_node_tree()
+        root = _nodes[0][0]
+        _ids = [_node.node_id for _node in root._iter_subtree()]
+        self.assertEqual(_ids, root.get_recursive_ids())
+
     def test_delete_node_references__no_children_not_recursive(self):
         root = GenericNode(node_id=0)
         node = GenericNode(node_id=1, parent=root)
@@ -145,6 +145,67 @@ class TestWorkflowNode(unittest.TestCase):
                 self.assertIsNotNone(_node.results)
                 self.assertIsNotNone(_node.result_kws)
 
+    def test_execute_plugin_chain__depth_first_order(self):
+        _order = []
+
+        def _make_execute(node):
+            _execute = node.plugin.execute
+
+            def _wrapped_execute(data, **kwargs):
+                _order.append(node.node_id)
+                return _execute(data, **kwargs)
+
+            return _wrapped_execute
+
+        nodes, n_nodes = self.create_node_tree(depth=2, width=2)
+        for _tier in nodes:
+            for _node in _tier:
+                _node.plugin.execute = _make_execute(_node)
+        nodes[0][0].execute_plugin_chain(0)
+        self.assertEqual(_order, [0, 1, 3, 4, 2, 5, 6])
+
+    def test_execute_plugin_chain__branch_input_copies(self):
+        _inputs = {}
+        _results = []
+
+        def _make_execute(node):
+            _execute = node.plugin.execute
+
+            def _wrapped_execute(data, **kwargs):
+                _inputs[node.node_id] = data
+                _results.append(_execute(data, **kwargs)[0])
+                return _results[-1], kwargs
+
+            return _wrapped_execute
+
+        nodes, n_nodes = self.create_node_tree(depth=1, width=3)
+        for _node in nodes[0] + nodes[1]:
+            _node.plugin.execute = _make_execute(_node)
+        nodes[0][0].execute_plugin_chain(0)
+        self.assertIsNot(_inputs[1], _results[0])
+        self.assertIsNot(_inputs[2], _results[0])
+        self.assertIs(_inputs[3], _results[0])
+
+    def test_execute_plugin_chain__leaf_results_not_copied(self):
+        nodes, n_nodes = self.create_node_tree(depth=1, width=1)
+        _leaf = nodes[1][0]
+        _execute = _leaf.plugin.execute
+        _returned = []
+
+        def _wrapped_execute(data, **kwargs):
+            _returned.append(_execute(data, **kwargs)[0])
+            return _returned[-1], kwargs
+
+        _leaf.plugin.execute = _wrapped_execute
+        nodes[0][0].execute_plugin_chain(0)
+        self.assertIs(_leaf.results, _returned[0])
+
+    def test_execute_plugin__results_copied(self):
+        obj = WorkflowNode(plugin=DummyLoader())
+        _res, _kwargs = obj.execute_plugin(0)
+        self.assertIsNot(obj.results, _res)
+        self.assertTrue(np.allclose(obj.results, _res))
+
     def test_execute_plugin__simple(self):
         obj = WorkflowNode(plugin=DummyLoader())
         _res = obj.execute_plugin(0)
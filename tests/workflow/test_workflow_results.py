@@ -338,6 +338,9 @@ class TestWorkflowResults(unittest.TestCase):
         res._create_composites()
         self.assertEqual(res._composites[1].shape, SCAN.shape + self._input_shape)
         self.assertEqual(res._composites[2].shape, SCAN.shape + self._new_shape)
+        for _composite in res._composites.values():
+            self.assertIsInstance(_composite, Dataset)
+            self.assertTrue(np.all(np.isnan(_composite)))
 
     def test_create_composites__shapes_unset(self):
         res = WorkflowResults()